@@ -7,8 +7,6 @@
 
 from server.server import A2AServer
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
-from agents.aviation_weather_agent.task_manager import AviationWeatherTaskManager
-from agents.aviation_weather_agent.agent import AviationWeatherAgent
 
 import click
 import logging
@@ -27,6 +25,10 @@ def main(host, port):
     DISCLAIMER: This agent provides weather data for informational purposes only.
     Do not use for actual flight planning or operational decisions.
     """
+
+    # Imported after option parsing so `--help` stays fast
+    from agents.aviation_weather_agent.task_manager import AviationWeatherTaskManager
+    from agents.aviation_weather_agent.agent import AviationWeatherAgent
     
     logger.info("=" * 60)
     logger.info("AVIATION WEATHER AGENT - DISCLAIMER")
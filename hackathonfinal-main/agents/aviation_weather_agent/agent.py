@@ -33,6 +33,9 @@ class AviationWeatherAgent:
     """Agent that provides aviation weather information for informational purposes."""
     
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
+    
+    # MCP tools this agent exposes; a frozenset gives O(1) membership tests
+    WEATHER_TOOL_NAMES = frozenset({"get_metar", "get_taf", "get_pireps", "get_route_weather"})
 
     def __init__(self):
         """
@@ -45,9 +48,10 @@ class AviationWeatherAgent:
         # Find aviation weather tools
         self.weather_tools = []
         for tool in mcp_tools:
-            if tool.name in ["get_metar", "get_taf", "get_pireps", "get_route_weather"]:
+            if tool.name in self.WEATHER_TOOL_NAMES:
                 self.weather_tools.append(tool)
                 logger.info(f"Loaded MCP tool: {tool.name}")
+        self.mcp_tools = self.weather_tools  # Spawned at startup by A2AServer
         
         self._agent = self._build_agent()
         self._user_id = "aviation_weather_user"
@@ -160,11 +164,6 @@ class AviationWeatherAgent:
             "- Interpret cloud layers and ceilings\n"
             "- Highlight IFR/MVFR/VFR conditions\n\n"
             
-            f"CONTEXT:\n"
-            f"- Current UTC time: {today.strftime('%H:%M:%S')}Z\n"
-            f"- Current date: {today.strftime('%Y-%m-%d')}\n"
-            f"- Remember: Aviation uses UTC/Zulu time\n\n"
-            
             "QUANTITATIVE OUTPUT REQUIREMENTS:\n"
             "- Always lead with specific numbers: wind speeds in knots, visibility in SM/meters\n"
             "- Show trends: 'Visibility improving from 2SM to 10SM over next 6 hours'\n"
@@ -186,6 +185,14 @@ class AviationWeatherAgent:
             
             "Remember: You're providing weather information to help users understand "
             "aviation weather, but they must use official sources for actual flight operations."
+            
+            # The clock changes on every call, so it trails the static briefing
+            # text and leaves that prefix cacheable
+            "\n\n"
+            f"CONTEXT:\n"
+            f"- Current UTC time: {today.strftime('%H:%M:%S')}Z\n"
+            f"- Current date: {today.strftime('%Y-%m-%d')}\n"
+            f"- Remember: Aviation uses UTC/Zulu time\n"
         )
 
     async def invoke(self, query: str, session_id: str) -> str:
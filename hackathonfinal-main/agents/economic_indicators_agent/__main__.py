@@ -7,8 +7,6 @@
 
 from server.server import A2AServer
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
-from agents.economic_indicators_agent.task_manager import EconomicIndicatorsTaskManager
-from agents.economic_indicators_agent.agent import EconomicIndicatorsAgent
 
 import click
 import logging
@@ -26,6 +24,10 @@ def main(host, port):
     
     This agent analyzes IMF economic data to predict flight demand patterns.
     """
+
+    # Imported after option parsing so `--help` stays fast
+    from agents.economic_indicators_agent.task_manager import EconomicIndicatorsTaskManager
+    from agents.economic_indicators_agent.agent import EconomicIndicatorsAgent
     
     logger.info("=" * 60)
     logger.info("ECONOMIC INDICATORS AGENT")
@@ -8,6 +8,7 @@
 
 from datetime import datetime
 import logging
+import re
 
 # Google ADK imports
 from google.adk.agents.llm_agent import LlmAgent
@@ -27,6 +28,10 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# IMF tools include list_datasets, get_dataset, list_indicators, etc.
+# One case-insensitive pass per tool name instead of lower() + five substring scans.
+IMF_TOOL_PATTERN = re.compile(r"dataset|indicator|series|countries|imf", re.IGNORECASE)
+
 
 class EconomicIndicatorsAgent:
     """Agent that analyzes economic indicators for flight demand forecasting."""
@@ -44,10 +49,10 @@ class EconomicIndicatorsAgent:
         # Find IMF data tools
         self.imf_tools = []
         for tool in mcp_tools:
-            # IMF tools include list_datasets, get_dataset, list_indicators, etc.
-            if any(keyword in tool.name.lower() for keyword in ['dataset', 'indicator', 'series', 'countries', 'imf']):
+            if IMF_TOOL_PATTERN.search(tool.name):
                 self.imf_tools.append(tool)
                 logger.info(f"Loaded IMF tool: {tool.name}")
+        self.mcp_tools = self.imf_tools  # Spawned at startup by A2AServer
         
         self._agent = self._build_agent()
         self._user_id = "economic_indicators_user"
@@ -163,11 +168,6 @@ class EconomicIndicatorsAgent:
             "   - Medium-term (3-12 months): GDP trends, inflation\n"
             "   - Long-term (1-3 years): Structural economic changes\n\n"
             
-            f"CONTEXT:\n"
-            f"- Today's date: {today.strftime('%Y-%m-%d')}\n"
-            f"- Current quarter: Q{(today.month-1)//3 + 1} {today.year}\n"
-            f"- Analysis should consider seasonality\n\n"
-            
             "QUANTITATIVE OUTPUT REQUIREMENTS:\n"
             "- Always lead with specific numbers: GDP growth %, exchange rates, inflation %\n"
             "- Show trends: 'GDP up 2.3% YoY', 'EUR/USD down 5% over past quarter'\n"
@@ -192,6 +192,14 @@ class EconomicIndicatorsAgent:
             "- Consider United's competitive position\n"
             "- Provide actionable recommendations for United's network planning team\n"
             "- Support collaboration with GoogleNewsAgent for comprehensive demand analysis"
+            
+            # Date context last, after the static guidance, so the prompt prefix
+            # stays identical between calls
+            "\n\n"
+            f"CONTEXT:\n"
+            f"- Today's date: {today.strftime('%Y-%m-%d')}\n"
+            f"- Current quarter: Q{(today.month-1)//3 + 1} {today.year}\n"
+            f"- Analysis should consider seasonality\n"
         )
 
     async def invoke(self, query: str, session_id: str) -> str:
@@ -7,8 +7,6 @@
 
 from server.server import A2AServer
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
-from agents.flight_agent.task_manager import FlightTaskManager
-from agents.flight_agent.agent import FlightIntelligenceAgent
 
 import click
 import logging
@@ -27,6 +25,10 @@ def main(host, port):
     Provides comprehensive flight search and pricing intelligence for United Airlines
     demand forecasting using both Amadeus and Duffel APIs.
     """
+
+    # Imported after option parsing so `--help` stays fast
+    from agents.flight_agent.task_manager import FlightTaskManager
+    from agents.flight_agent.agent import FlightIntelligenceAgent
     
     logger.info("=" * 60)
     logger.info("FLIGHT INTELLIGENCE AGENT")
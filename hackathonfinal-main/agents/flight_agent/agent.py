@@ -39,6 +39,39 @@ class FlightIntelligenceAgent:
     """
     
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
+    
+    # Amadeus tool names
+    AMADEUS_TOOL_NAMES = frozenset({
+        "flight-price-analysis",
+        "flight-offers-search",
+        "flight-inspiration-search",
+        "airport-routes",
+        "airline-routes",
+        "flight-delay-prediction",
+        "airport-on-time-performance"
+    })
+    
+    # Duffel tool names (based on the actual MCP server implementation)
+    DUFFEL_TOOL_NAMES = frozenset({
+        "search_flights",
+        "get_offer_details",
+        "search_multi_city"
+    })
+    
+    # SQL/DuckDB tool names for historical analysis
+    SQL_TOOL_NAMES = frozenset({
+        "analyze-flight-sql",
+        "get-route-prices",
+        "analyze-price-trends",
+        "check-weather-impact"
+    })
+    
+    # Tool name -> provider label, so each tool is classified with one lookup
+    TOOL_SOURCES = (
+        dict.fromkeys(AMADEUS_TOOL_NAMES, "Amadeus")
+        | dict.fromkeys(DUFFEL_TOOL_NAMES, "Duffel")
+        | dict.fromkeys(SQL_TOOL_NAMES, "SQL/DuckDB")
+    )
 
     def __init__(self):
         """
@@ -50,40 +83,12 @@ class FlightIntelligenceAgent:
         
         # Find flight tools from both Amadeus and Duffel
         self.flight_tools = []
-        
-        # Amadeus tool names
-        amadeus_tool_names = [
-            "flight-price-analysis",
-            "flight-offers-search",
-            "flight-inspiration-search",
-            "airport-routes",
-            "airline-routes",
-            "flight-delay-prediction",
-            "airport-on-time-performance"
-        ]
-        
-        # Duffel tool names (based on the actual MCP server implementation)
-        duffel_tool_names = [
-            "search_flights",
-            "get_offer_details",
-            "search_multi_city"
-        ]
-        
-        # SQL/DuckDB tool names for historical analysis
-        sql_tool_names = [
-            "analyze-flight-sql",
-            "get-route-prices",
-            "analyze-price-trends",
-            "check-weather-impact"
-        ]
-        
-        # Combine all tool names
-        all_flight_tools = amadeus_tool_names + duffel_tool_names + sql_tool_names
+        self.mcp_tools = self.flight_tools  # Spawned at startup by A2AServer
         
         for tool in mcp_tools:
-            if tool.name in all_flight_tools:
+            source = self.TOOL_SOURCES.get(tool.name)
+            if source:
                 self.flight_tools.append(tool)
-                source = 'Amadeus' if tool.name in amadeus_tool_names else ('Duffel' if tool.name in duffel_tool_names else 'SQL/DuckDB')
                 logger.info(f"Loaded MCP tool: {tool.name} from {source}")
         
         self._agent = self._build_agent()
@@ -200,7 +205,10 @@ class FlightIntelligenceAgent:
             "- Use Amadeus for: GDS inventory, route analysis, delay predictions, real-time data\n"
             "- Use Duffel for: Modern search features, complex itineraries, detailed filtering\n"
             "- Use SQL/DuckDB for: Historical trends, weather correlations, price spike analysis, trend patterns\n"
-            "- Combine all sources for comprehensive market intelligence\n\n"
+            "- Combine all sources for comprehensive market intelligence\n"
+            "- When lookups don't depend on each other's results (e.g. live Amadeus fares plus "
+            "SQL price history for the same route), request all of those tool calls together in "
+            "one turn instead of one per turn\n\n"
             
             "UNITED AIRLINES FOCUS:\n"
             "- Primary hubs: ORD (Chicago), DEN (Denver), IAH (Houston), EWR (Newark), "
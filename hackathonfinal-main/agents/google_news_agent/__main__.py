@@ -7,8 +7,6 @@
 
 from server.server import A2AServer
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
-from agents.google_news_agent.task_manager import GoogleNewsTaskManager
-from agents.google_news_agent.agent import GoogleNewsAgent
 
 import click
 import logging
@@ -26,6 +24,10 @@ def main(host, port):
     
     This agent searches and analyzes Google News for flight demand insights.
     """
+
+    # Imported after option parsing so `--help` stays fast
+    from agents.google_news_agent.task_manager import GoogleNewsTaskManager
+    from agents.google_news_agent.agent import GoogleNewsAgent
     
     logger.info("=" * 60)
     logger.info("GOOGLE NEWS AGENT")
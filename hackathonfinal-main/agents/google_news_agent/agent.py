@@ -50,6 +50,7 @@ class GoogleNewsAgent:
             if tool.name == "google_news_search":
                 self.news_tools.append(tool)
                 logger.info(f"Loaded Google News tool: {tool.name}")
+        self.mcp_tools = self.news_tools  # Spawned at startup by A2AServer
         
         # Initialize A2A discovery for agent collaboration
         self.discovery = DiscoveryClient()
@@ -157,8 +158,9 @@ class GoogleNewsAgent:
         """Generate system instructions for the Google News Agent."""
         today = datetime.now().strftime("%Y-%m-%d")
         
+        # The date goes last so the long static prefix stays cacheable across calls
         return f"""You are a specialized Google News analyst for UNITED AIRLINES flight demand prediction.
-Today's date is {today}. Your mission is to identify news events that specifically impact United's route network and demand.
+Your mission is to identify news events that specifically impact United's route network and demand.
 
 UNITED AIRLINES FOCUS AREAS:
 - Major hubs: Chicago (ORD), Denver (DEN), Houston (IAH), Newark (EWR), San Francisco (SFO), Washington (IAD), Los Angeles (LAX)
@@ -232,7 +234,9 @@ For each news item:
 - Timeframe: Immediate (0-7 days), Short-term (1-4 weeks), Long-term (1-6 months)
 - Recommended United action with quantified benefit
 
-Remember: Every analysis must tie back to UNITED AIRLINES demand, not generic airline industry trends."""
+Remember: Every analysis must tie back to UNITED AIRLINES demand, not generic airline industry trends.
+
+Today's date is {today}."""
 
 
     async def invoke(self, query: str, session_id: str) -> str:
@@ -17,10 +17,6 @@ from models.agent import (
     AgentCapabilities,                # Describes streaming & other features
     AgentSkill                       # Describes a specific skill the agent offers
 )
-from agents.greeting_agent.task_manager import GreetingTaskManager
-                                      # TaskManager that adapts GreetingAgent to A2A
-from agents.greeting_agent.agent import GreetingAgent
-                                      # Our custom orchestration agent logic
 
 # -----------------------------------------------------------------------------
 # ⚙️ Logging setup
@@ -56,6 +52,10 @@ def main(host: str, port: int):
     # Print a friendly banner so the user knows the server is starting
     print(f"\n🚀 Starting GreetingAgent on http://{host}:{port}/\n")
 
+    # Imported after option parsing so `--help` stays fast
+    from agents.greeting_agent.task_manager import GreetingTaskManager
+    from agents.greeting_agent.agent import GreetingAgent
+
     # -------------------------------------------------------------------------
     # 1) Define the agent’s capabilities
     # -------------------------------------------------------------------------
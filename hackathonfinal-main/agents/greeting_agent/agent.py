@@ -99,20 +99,21 @@ class GreetingAgent:
             # Re-fetch registry each call to catch new agents dynamically
             cards = await self.discovery.list_agent_cards()
 
-            # Try to match exactly by name or id (case-insensitive)
-            matched = next(
-                (c for c in cards
-                 if c.name.lower() == agent_name.lower()
-                 or getattr(c, "id", "").lower() == agent_name.lower()),
-                None
-            )
+            # Match exactly by name or id (case-insensitive), remembering the
+            # first substring match as a fallback - one pass, one lower() per card
+            wanted = agent_name.lower()
+            matched = partial = None
+            for c in cards:
+                name = c.name.lower()
+                if name == wanted or getattr(c, "id", "").lower() == wanted:
+                    matched = c
+                    break
+                if partial is None and wanted in name:
+                    partial = c
 
             # Fallback: substring match if no exact found
             if not matched:
-                matched = next(
-                    (c for c in cards if agent_name.lower() in c.name.lower()),
-                    None
-                )
+                matched = partial
 
             # If still nothing, error out
             if not matched:
@@ -143,32 +144,17 @@ class GreetingAgent:
 
 
         # --- System instruction for the LLM ---
+        # Sent with every turn, so kept to terse directives; the tools' own
+        # signatures and docstrings already reach the model as declarations
         system_instr = (
-            "You are a sophisticated greeting agent with poetic sensibilities.\n\n"
-            
-            "AVAILABLE TOOLS:\n"
-            "1) list_agents() - Discover available agents and their capabilities\n"
-            "2) call_agent(agent_name, message) - Communicate with other agents\n\n"
-            
-            "GREETING PROTOCOL:\n"
-            "When asked to greet or provide a greeting:\n"
-            "1. First, use list_agents() to see what agents are available\n"
-            "2. Find an agent that can tell time (usually 'WebScrapingAgent' which has time capabilities)\n"
-            "3. Call that agent with an appropriate time query\n"
-            "4. Create a beautiful, contextual 2-3 line poetic greeting that:\n"
-            "   - References the current time naturally\n"
-            "   - Matches the mood of the time of day\n"
-            "   - Feels personalized and warm\n\n"
-            
-            "INTELLIGENT BEHAVIOR:\n"
-            "- Adapt greetings to context (morning/afternoon/evening/night)\n"
-            "- If time agent is unavailable, create a timeless greeting\n"
-            "- Be creative but concise - aim for elegance\n"
-            "- Consider seasonal or weather metaphors when appropriate\n"
-            "- Make each greeting unique and memorable\n\n"
-            
-            "Remember: You're not just executing a task, you're creating a moment of "
-            "connection through thoughtful, time-aware poetry."
+            "Role: poetic greeting agent.\n"
+            "To greet:\n"
+            "1. list_agents() to find an agent that tells time (usually WebScrapingAgent).\n"
+            "2. call_agent() it with a time query.\n"
+            "3. Reply with a unique, warm 2-3 line poem that references the time and "
+            "matches its mood (morning/afternoon/evening/night); seasonal or weather "
+            "imagery welcome.\n"
+            "If no time agent responds, write a timeless greeting. Elegant, concise."
         )
 
         # Wrap our Python functions into ADK FunctionTool objects
@@ -15,16 +15,56 @@ import click                                # Third-party library for building c
 from utilities.a2a.agent_discovery import DiscoveryClient  # Utility to discover other A2A agents via a JSON registry
 from server.server import A2AServer           # The core A2A server implementation (Starlette + JSON-RPC)
 from models.agent import AgentCard, AgentCapabilities, AgentSkill  # Pydantic models describing agent metadata
-from agents.host_agent.orchestrator import (
-    OrchestratorAgent,                        # The in-process orchestrator logic (routes tasks)
-    OrchestratorTaskManager                   # Exposes the orchestrator over JSON-RPC
-)
 
 # Configure the root logger to display INFO-level and above messages
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)          # Create a logger instance specific to this module
 
 
+# -----------------------------------------------------------------------------
+# 🪪 Agent metadata: built once at import, only the URL varies per launch
+# -----------------------------------------------------------------------------
+CAPABILITIES = AgentCapabilities(streaming=False)  # Indicates this agent does not support streaming
+SKILLS = [
+    AgentSkill(
+        id="orchestrate",                          # Unique internal identifier for the skill
+        name="Orchestrate Tasks",                  # Human-friendly name shown in UIs
+        description=(
+            "Routes user requests to child A2A agents or MCP tools based on intent."
+        ),
+        tags=["routing", "orchestration"],        # Keywords to help clients discover this skill
+        examples=[                                  # Sample queries to illustrate usage
+            "What is the time?",
+            "Greet me",
+            "Search the latest funding news for Acme Corp",
+        ]
+    )
+]
+
+
+def build_agent_card(host: str, port: int) -> AgentCard:
+    """
+    Build the AgentCard served at /.well-known/agent.json.
+
+    Args:
+        host: Address the server binds to
+        port: Port the server listens on
+
+    Returns:
+        AgentCard: Orchestrator metadata pointing at http://{host}:{port}/
+    """
+    return AgentCard(
+        name="OrchestratorAgent",                # Unique agent name
+        description="Delegates to TellTimeAgent, GreetingAgent, and MCP tools",
+        url=f"http://{host}:{port}/",            # Public endpoint where this agent listens
+        version="1.0.0",                         # Semantic version of this agent
+        defaultInputModes=["text"],              # Supported input modes
+        defaultOutputModes=["text"],             # Supported output modes
+        capabilities=CAPABILITIES,                 # Streaming capabilities
+        skills=SKILLS                              # Which skills this agent provides
+    )
+
+
 @click.command()                              # Declare this function as a CLI command entrypoint
 @click.option(
     "--host", default="localhost",
@@ -51,6 +91,12 @@ def main(host: str, port: int, registry: str):
     3) Wrap it in OrchestratorTaskManager
     4) Launch the JSON-RPC server
     """
+    # Imported after option parsing so `--help` stays fast
+    from agents.host_agent.orchestrator import (
+        OrchestratorAgent,                    # The in-process orchestrator logic (routes tasks)
+        OrchestratorTaskManager               # Exposes the orchestrator over JSON-RPC
+    )
+
     # 1) Discover child A2A agents from the registry file or default location
     discovery = DiscoveryClient(registry_file=registry)
     # list_agent_cards() is async, so we run it via asyncio.run to get the result synchronously
@@ -62,35 +108,15 @@ def main(host: str, port: int, registry: str):
             "No A2A agents found – the orchestrator will have nothing to call"
         )
 
-    # 2) Define this host agent’s own metadata for discovery by other clients
-    capabilities = AgentCapabilities(streaming=False)  # Indicates this agent does not support streaming
-    skill = AgentSkill(
-        id="orchestrate",                          # Unique internal identifier for the skill
-        name="Orchestrate Tasks",                  # Human-friendly name shown in UIs
-        description=(
-            "Routes user requests to child A2A agents or MCP tools based on intent."
-        ),
-        tags=["routing", "orchestration"],        # Keywords to help clients discover this skill
-        examples=[                                  # Sample queries to illustrate usage
-            "What is the time?",
-            "Greet me",
-            "Search the latest funding news for Acme Corp",
-        ]
-    )
-    # Build the AgentCard, which is served at /.well-known/agent.json
-    orchestrator_card = AgentCard(
-        name="OrchestratorAgent",                # Unique agent name
-        description="Delegates to TellTimeAgent, GreetingAgent, and MCP tools",
-        url=f"http://{host}:{port}/",            # Public endpoint where this agent listens
-        version="1.0.0",                         # Semantic version of this agent
-        defaultInputModes=["text"],              # Supported input modes
-        defaultOutputModes=["text"],             # Supported output modes
-        capabilities=capabilities,                 # Streaming capabilities
-        skills=[skill]                             # Which skills this agent provides
-    )
+    # 2) Build this host agent’s own metadata for discovery by other clients
+    orchestrator_card = build_agent_card(host, port)
 
     # 3) Instantiate the orchestrator logic and its JSON-RPC task manager
-    orchestrator = OrchestratorAgent(agent_cards=agent_cards, registry_file=registry)
+    orchestrator = OrchestratorAgent(
+        agent_cards=agent_cards,
+        registry_file=registry,
+        discovery_client=discovery,                # Reuse the already-loaded registry
+    )
     task_manager = OrchestratorTaskManager(agent=orchestrator)
 
     # 4) Construct and launch the A2A server
@@ -9,15 +9,55 @@ import click
 from utilities.a2a.agent_discovery import DiscoveryClient
 from server.sse_server import SSEServer  # Use our enhanced SSE server
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
-from agents.host_agent.orchestrator import (
-    OrchestratorAgent,
-    OrchestratorTaskManager
-)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# -----------------------------------------------------------------------------
+# 🪪 Agent metadata: host/port-independent parts are validated once at import
+# -----------------------------------------------------------------------------
+CAPABILITIES = AgentCapabilities(streaming=True)  # Enable streaming!
+SKILLS = [
+    AgentSkill(
+        id="orchestrate",
+        name="Orchestrate Tasks",
+        description=(
+            "Routes user requests to child A2A agents or MCP tools based on intent."
+        ),
+        tags=["routing", "orchestration", "streaming"],
+        examples=[
+            "What is the time?",
+            "Greet me",
+            "Search the latest funding news for Acme Corp",
+        ]
+    )
+]
+
+
+def build_agent_card(host: str, port: int) -> AgentCard:
+    """
+    Build the streaming orchestrator's AgentCard; only the URL varies per launch.
+
+    Args:
+        host: Address the server binds to
+        port: Port the server listens on
+
+    Returns:
+        AgentCard: SSE orchestrator metadata pointing at http://{host}:{port}/
+    """
+    return AgentCard(
+        name="OrchestratorAgent",
+        description="Delegates to child agents with SSE streaming support",
+        url=f"http://{host}:{port}/",
+        version="1.1.0",  # Bumped version for SSE
+        defaultInputModes=["text"],
+        defaultOutputModes=["text"],
+        capabilities=CAPABILITIES,
+        skills=SKILLS
+    )
+
+
 @click.command()
 @click.option(
     "--host", default="localhost",
@@ -38,6 +78,12 @@ def main(host: str, port: int, registry: str):
     """
     Starts the OrchestratorAgent A2A server with SSE support.
     """
+    # Imported after option parsing so `--help` stays fast
+    from agents.host_agent.orchestrator import (
+        OrchestratorAgent,
+        OrchestratorTaskManager
+    )
+
     # 1) Discover child A2A agents
     discovery = DiscoveryClient(registry_file=registry)
     agent_cards = asyncio.run(discovery.list_agent_cards())
@@ -48,34 +94,14 @@ def main(host: str, port: int, registry: str):
         )
 
     # 2) Define this host agent's metadata with streaming enabled
-    capabilities = AgentCapabilities(streaming=True)  # Enable streaming!
-    skill = AgentSkill(
-        id="orchestrate",
-        name="Orchestrate Tasks",
-        description=(
-            "Routes user requests to child A2A agents or MCP tools based on intent."
-        ),
-        tags=["routing", "orchestration", "streaming"],
-        examples=[
-            "What is the time?",
-            "Greet me",
-            "Search the latest funding news for Acme Corp",
-        ]
-    )
-    
-    orchestrator_card = AgentCard(
-        name="OrchestratorAgent",
-        description="Delegates to child agents with SSE streaming support",
-        url=f"http://{host}:{port}/",
-        version="1.1.0",  # Bumped version for SSE
-        defaultInputModes=["text"],
-        defaultOutputModes=["text"],
-        capabilities=capabilities,
-        skills=[skill]
-    )
+    orchestrator_card = build_agent_card(host, port)
 
     # 3) Instantiate the orchestrator logic and task manager
-    orchestrator = OrchestratorAgent(agent_cards=agent_cards, registry_file=registry)
+    orchestrator = OrchestratorAgent(
+        agent_cards=agent_cards,
+        registry_file=registry,
+        discovery_client=discovery,                # Reuse the already-loaded registry
+    )
     task_manager = OrchestratorTaskManager(agent=orchestrator)
 
     # 4) Use SSE server instead of regular server
@@ -14,7 +14,7 @@ import logging                         # For writing log messages to console or
 import asyncio                         # For running asynchronous tasks from synchronous code
 from dotenv import load_dotenv         # To load environment variables from a .env file
 import time                            # For tracking last discovery time
-from typing import Optional            # For optional type hints
+from typing import Optional, AsyncIterator  # For optional and streaming type hints
 import threading                       # For background discovery task
 
 # Load environment variables from .env (e.g., GOOGLE_API_KEY)
@@ -28,13 +28,15 @@ from google.adk.sessions import InMemorySessionService          # Simple in-memo
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService  # In-memory memory storage
 from google.adk.artifacts import InMemoryArtifactService        # In-memory artifact storage (files, binaries)
 from google.adk.runners import Runner                           # Coordinates LLM, sessions, memory, and tools
+from google.adk.agents.run_config import RunConfig, StreamingMode  # Opt-in token streaming for stream()
 from google.adk.agents.readonly_context import ReadonlyContext  # Provides read-only context to system prompts
 from google.adk.tools.tool_context import ToolContext           # Carries state between tool invocations
 from google.adk.tools.function_tool import FunctionTool         # Wraps a Python function as a callable LLM tool
 from google.genai import types                                 # For wrapping user messages into LLM-friendly format
 
 # For date awareness
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache           # Memoizes the per-day date block
 
 # -----------------------------------------------------------------------------
 # A2A infrastructure imports: task manager and message models for JSON-RPC
@@ -63,6 +65,125 @@ logger = logging.getLogger(__name__)                           # Create a logger
 logging.basicConfig(level=logging.INFO)                        # Show INFO-level logs in the console
 
 
+# -----------------------------------------------------------------------------
+# Static system prompt: kept byte-identical across calls so the model can reuse
+# its cached prefix. Anything that changes per call (dates) goes AFTER it.
+# -----------------------------------------------------------------------------
+ROOT_INSTRUCTION = (
+    "You are UNITED AIRLINES' Chief Intelligence Orchestrator, coordinating all analysis agents\n"
+    "to provide comprehensive flight demand predictions and insights for United's network.\n\n"
+    
+    "UNITED AIRLINES CONTEXT:\n"
+    "- You coordinate specialized agents to analyze factors affecting United's flight demand\n"
+    "- Focus on United's hubs: ORD, DEN, IAH, EWR, SFO, IAD, LAX\n"
+    "- Consider United's competitive position vs Delta, American, Southwest\n"
+    "- Optimize for United's revenue, not just passenger volume\n\n"
+    
+    "AVAILABLE CAPABILITIES:\n"
+    "1) A2A Agents: _list_agents() to see available agents, _delegate_task(agent_name, message) to call them\n"
+    "2) Each agent has specific capabilities - use _list_agents() to discover them\n"
+    "3) When a question needs several agents whose answers don't depend on each other, call\n"
+    "   _delegate_tasks(agent_names, messages) once; they run in parallel and replies come back in order\n\n"
+    
+    "UNITED-FOCUSED ROUTING:\n"
+    "- United route/hub weather analysis → AviationWeatherAgent\n"
+    "- Events at United hub cities or affecting United routes → LiveEventsAgent\n"
+    "- Economic factors for United's markets → EconomicIndicatorsAgent\n"
+    "- News about United, competitors, or aviation industry → GoogleNewsAgent\n"
+    "- Flight booking sites, United.com analysis → WebScrapingAgent\n"
+    "- Flight pricing, route analysis, competitor comparison → FlightIntelligenceAgent\n"
+    "- General greetings → GreetingAgent\n\n"
+    
+    "INTEGRATED ANALYSIS PATTERNS:\n"
+    "- 'United demand forecast for Chicago' → LiveEventsAgent + AviationWeatherAgent + EconomicIndicatorsAgent\n"
+    "- 'Impact of fuel prices on United' → GoogleNewsAgent + EconomicIndicatorsAgent\n"
+    "- 'United's Pacific route analysis' → EconomicIndicatorsAgent + GoogleNewsAgent + AviationWeatherAgent\n"
+    "- 'Competitor analysis for United' → GoogleNewsAgent + WebScrapingAgent\n\n"
+    
+    "COMPOUND REQUEST HANDLING:\n"
+    "- When users ask for multiple things (e.g., 'give me a greeting AND fetch content'):\n"
+    "  1. Identify ALL requested tasks\n"
+    "  2. Execute each task by calling appropriate agents\n"
+    "  3. Combine and present ALL results to the user\n"
+    "- NEVER forget to complete any part of a multi-part request\n"
+    "- Execute tasks in logical order (e.g., greeting before content fetch)\n\n"
+    
+    "ERROR HANDLING:\n"
+    "- If an agent returns an error, explain it clearly to the user\n"
+    "- For LiveEventsAgent errors: mention it might be an API issue and suggest trying again\n"
+    "- Always provide context about what went wrong\n"
+    "- Suggest alternatives when appropriate\n\n"
+    
+    "RESPONSE SYNTHESIS:\n"
+    "- ALWAYS clearly attribute which agent provided which information\n"
+    "- Use format like: 'According to [AgentName]:' or '[AgentName] reports:'\n"
+    "- For multiple agent calls, structure the response with clear sections\n"
+    "- Label each section with the contributing agent(s)\n"
+    "- Example: '### Economic Analysis (from EconomicIndicatorsAgent)'\n"
+    "- Maintain the original agent's response quality\n"
+    "- Add brief transitions between different agent responses\n"
+    "- In summary sections, cite which agents contributed key insights\n\n"
+    
+    "QUANTITATIVE SYNTHESIS REQUIREMENTS:\n"
+    "- Aggregate numerical data from multiple agents into unified insights\n"
+    "- Calculate combined impact: 'Total demand impact: +23% (Events: +15%, Weather: -5%, Economics: +13%)'\n"
+    "- Show cross-agent correlations: 'High fuel prices ($3.45/gal) + 3 major Chicago events = Est. $2.3M revenue opportunity'\n"
+    "- Provide confidence ranges when combining uncertain data: 'Demand forecast: 85-92% load factor'\n"
+    "- Summarize with key metrics dashboard:\n"
+    "  • Total flights analyzed: X across Y routes\n"
+    "  • Price range: $XXX-$YYYY (median: $ZZZ)\n"
+    "  • Weather impact: -X% capacity at Z hubs\n"
+    "  • Event-driven demand: +X% for Y cities\n"
+    "  • Competitive position: United X% vs Delta Y% market share\n"
+    "- Always conclude with specific, quantified recommendations\n\n"
+    
+    "BEST PRACTICES:\n"
+    "- Always validate and sanitize inputs before passing to agents\n"
+    "- Think step-by-step about user intent\n"
+    "- Be thorough - complete ALL requested tasks\n"
+    "- Preserve the unique character of each agent's response\n"
+    "- If unsure about routing, explain your reasoning\n\n"
+    
+    "UNITED DEMAND PREDICTION FOCUS:\n"
+    "When analyzing for United, always consider:\n"
+    "1. Revenue impact (not just passenger numbers)\n"
+    "2. Premium cabin demand (business/first class)\n"
+    "3. Cargo opportunities on routes\n"
+    "4. MileagePlus member engagement\n"
+    "5. Competitive advantages/threats\n\n"
+    
+    "Remember: You're United's orchestrator. Every analysis should ultimately help United\n"
+    "optimize its network, pricing, and competitive position. Coordinate agents to provide\n"
+    "integrated insights, not isolated data points.\n\n"
+)
+
+
+# Runner config for stream(): SSE mode makes Gemini return the reply in chunks
+STREAMING_RUN_CONFIG = RunConfig(streaming_mode=StreamingMode.SSE)
+
+
+@lru_cache(maxsize=2)
+def _date_awareness_block(today: date) -> str:
+    """
+    Build the DATE/TIME AWARENESS section of the system prompt for a given day.
+
+    Cached per calendar day, so the strftime calls run once a day instead of
+    on every model call.
+
+    Args:
+        today (date): The current calendar date.
+    """
+    tomorrow = today + timedelta(days=1)
+    return (
+        f"DATE/TIME AWARENESS:\n"
+        f"- Today is {today.strftime('%A, %B %d, %Y')} ({today.strftime('%Y-%m-%d')})\n"
+        f"- Tomorrow is {tomorrow.strftime('%A, %B %d, %Y')} ({tomorrow.strftime('%Y-%m-%d')})\n"
+        f"- When users say 'tomorrow', 'next month', etc., calculate from today's date\n"
+        f"- For LiveEventsAgent, provide specific date ranges (start_date and end_date)\n"
+        f"- Example: 'tomorrow' = {tomorrow.strftime('%Y-%m-%d')} to {tomorrow.strftime('%Y-%m-%d')}"
+    )
+
+
 class OrchestratorAgent:
     """
     🤖 OrchestratorAgent:
@@ -76,17 +197,24 @@ class OrchestratorAgent:
     # Specify supported MIME types for input/output (we only handle plain text)
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
 
-    def __init__(self, agent_cards: list[AgentCard], registry_file: Optional[str] = None):
+    def __init__(
+        self,
+        agent_cards: list[AgentCard],
+        registry_file: Optional[str] = None,
+        discovery_client: Optional[DiscoveryClient] = None,
+    ):
         """
         Initialize the orchestrator with discovered A2A agents and MCP tools.
 
         Args:
             agent_cards (list[AgentCard]): Metadata for each A2A child agent.
             registry_file (Optional[str]): Path to agent registry file for re-discovery.
+            discovery_client (Optional[DiscoveryClient]): Client that produced
+                agent_cards; reused for re-discovery instead of building a second one.
         """
         # Store registry file path for re-discovery
         self.registry_file = registry_file
-        self.discovery_client = DiscoveryClient(registry_file=registry_file)
+        self.discovery_client = discovery_client or DiscoveryClient(registry_file=registry_file)
         self.last_discovery_time = time.time()
         self.discovery_lock = asyncio.Lock()
         self.failed_agents = set()  # Track agents that failed recently
@@ -106,6 +234,7 @@ class OrchestratorAgent:
             session_service=InMemorySessionService(),          # In-memory session storage
             memory_service=InMemoryMemoryService(),            # In-memory conversation memory
         )
+        self._known_sessions: set[str] = set()                 # Session IDs already created in the service
         
         # 3) Start periodic discovery task (optional)
         self._start_periodic_discovery()
@@ -121,6 +250,7 @@ class OrchestratorAgent:
         tools = [
             self._list_agents,    # Function listing child A2A agents
             self._delegate_task,  # Async function for routing to A2A agents
+            self._delegate_tasks, # Concurrent fan-out to several A2A agents
         ]
         # Create and return the LlmAgent
         return LlmAgent(
@@ -138,100 +268,8 @@ class OrchestratorAgent:
         Args:
             context (ReadonlyContext): Read-only context (unused here).
         """
-        today = datetime.now()
-        tomorrow = today + timedelta(days=1)
-        return (
-            "You are UNITED AIRLINES' Chief Intelligence Orchestrator, coordinating all analysis agents\n"
-            "to provide comprehensive flight demand predictions and insights for United's network.\n\n"
-            
-            "UNITED AIRLINES CONTEXT:\n"
-            "- You coordinate specialized agents to analyze factors affecting United's flight demand\n"
-            "- Focus on United's hubs: ORD, DEN, IAH, EWR, SFO, IAD, LAX\n"
-            "- Consider United's competitive position vs Delta, American, Southwest\n"
-            "- Optimize for United's revenue, not just passenger volume\n\n"
-            
-            "AVAILABLE CAPABILITIES:\n"
-            "1) A2A Agents: _list_agents() to see available agents, _delegate_task(agent_name, message) to call them\n"
-            "2) Each agent has specific capabilities - use _list_agents() to discover them\n\n"
-            
-            "UNITED-FOCUSED ROUTING:\n"
-            "- United route/hub weather analysis → AviationWeatherAgent\n"
-            "- Events at United hub cities or affecting United routes → LiveEventsAgent\n"
-            "- Economic factors for United's markets → EconomicIndicatorsAgent\n"
-            "- News about United, competitors, or aviation industry → GoogleNewsAgent\n"
-            "- Flight booking sites, United.com analysis → WebScrapingAgent\n"
-            "- Flight pricing, route analysis, competitor comparison → FlightIntelligenceAgent\n"
-            "- General greetings → GreetingAgent\n\n"
-            
-            "INTEGRATED ANALYSIS PATTERNS:\n"
-            "- 'United demand forecast for Chicago' → LiveEventsAgent + AviationWeatherAgent + EconomicIndicatorsAgent\n"
-            "- 'Impact of fuel prices on United' → GoogleNewsAgent + EconomicIndicatorsAgent\n"
-            "- 'United's Pacific route analysis' → EconomicIndicatorsAgent + GoogleNewsAgent + AviationWeatherAgent\n"
-            "- 'Competitor analysis for United' → GoogleNewsAgent + WebScrapingAgent\n\n"
-            
-            "COMPOUND REQUEST HANDLING:\n"
-            "- When users ask for multiple things (e.g., 'give me a greeting AND fetch content'):\n"
-            "  1. Identify ALL requested tasks\n"
-            "  2. Execute each task by calling appropriate agents\n"
-            "  3. Combine and present ALL results to the user\n"
-            "- NEVER forget to complete any part of a multi-part request\n"
-            "- Execute tasks in logical order (e.g., greeting before content fetch)\n\n"
-            
-            f"DATE/TIME AWARENESS:\n"
-            f"- Today is {today.strftime('%A, %B %d, %Y')} ({today.strftime('%Y-%m-%d')})\n"
-            f"- Tomorrow is {tomorrow.strftime('%A, %B %d, %Y')} ({tomorrow.strftime('%Y-%m-%d')})\n"
-            f"- When users say 'tomorrow', 'next month', etc., calculate from today's date\n"
-            f"- For LiveEventsAgent, provide specific date ranges (start_date and end_date)\n"
-            f"- Example: 'tomorrow' = {tomorrow.strftime('%Y-%m-%d')} to {tomorrow.strftime('%Y-%m-%d')}\n\n"
-            
-            "ERROR HANDLING:\n"
-            "- If an agent returns an error, explain it clearly to the user\n"
-            "- For LiveEventsAgent errors: mention it might be an API issue and suggest trying again\n"
-            "- Always provide context about what went wrong\n"
-            "- Suggest alternatives when appropriate\n\n"
-            
-            "RESPONSE SYNTHESIS:\n"
-            "- ALWAYS clearly attribute which agent provided which information\n"
-            "- Use format like: 'According to [AgentName]:' or '[AgentName] reports:'\n"
-            "- For multiple agent calls, structure the response with clear sections\n"
-            "- Label each section with the contributing agent(s)\n"
-            "- Example: '### Economic Analysis (from EconomicIndicatorsAgent)'\n"
-            "- Maintain the original agent's response quality\n"
-            "- Add brief transitions between different agent responses\n"
-            "- In summary sections, cite which agents contributed key insights\n\n"
-            
-            "QUANTITATIVE SYNTHESIS REQUIREMENTS:\n"
-            "- Aggregate numerical data from multiple agents into unified insights\n"
-            "- Calculate combined impact: 'Total demand impact: +23% (Events: +15%, Weather: -5%, Economics: +13%)'\n"
-            "- Show cross-agent correlations: 'High fuel prices ($3.45/gal) + 3 major Chicago events = Est. $2.3M revenue opportunity'\n"
-            "- Provide confidence ranges when combining uncertain data: 'Demand forecast: 85-92% load factor'\n"
-            "- Summarize with key metrics dashboard:\n"
-            "  • Total flights analyzed: X across Y routes\n"
-            "  • Price range: $XXX-$YYYY (median: $ZZZ)\n"
-            "  • Weather impact: -X% capacity at Z hubs\n"
-            "  • Event-driven demand: +X% for Y cities\n"
-            "  • Competitive position: United X% vs Delta Y% market share\n"
-            "- Always conclude with specific, quantified recommendations\n\n"
-            
-            "BEST PRACTICES:\n"
-            "- Always validate and sanitize inputs before passing to agents\n"
-            "- Think step-by-step about user intent\n"
-            "- Be thorough - complete ALL requested tasks\n"
-            "- Preserve the unique character of each agent's response\n"
-            "- If unsure about routing, explain your reasoning\n\n"
-            
-            "UNITED DEMAND PREDICTION FOCUS:\n"
-            "When analyzing for United, always consider:\n"
-            "1. Revenue impact (not just passenger numbers)\n"
-            "2. Premium cabin demand (business/first class)\n"
-            "3. Cargo opportunities on routes\n"
-            "4. MileagePlus member engagement\n"
-            "5. Competitive advantages/threats\n\n"
-            
-            "Remember: You're United's orchestrator. Every analysis should ultimately help United\n"
-            "optimize its network, pricing, and competitive position. Coordinate agents to provide\n"
-            "integrated insights, not isolated data points."
-        )
+        # Static prefix first, volatile date block last (rebuilt once per day)
+        return ROOT_INSTRUCTION + _date_awareness_block(date.today())
 
     def _list_agents(self) -> list[str]:
         """
@@ -242,10 +280,17 @@ class OrchestratorAgent:
         """
         return list(self.connectors.keys())
     
-    def _update_connectors(self, agent_cards: list[AgentCard]):
-        """Update connectors based on new agent cards."""
+    def _update_connectors(self, agent_cards: list[AgentCard]) -> list[AgentConnector]:
+        """
+        Update connectors based on new agent cards.
+
+        Returns:
+            list[AgentConnector]: Connectors that were replaced or removed; the
+                caller should close() them to release their pooled connections.
+        """
         # Track which agents we've seen
         seen_agents = set()
+        retired = []
         
         for card in agent_cards:
             seen_agents.add(card.name)
@@ -256,6 +301,7 @@ class OrchestratorAgent:
                 logger.info(f"[Discovery] New agent discovered: {card.name} at {card.url}")
             elif self.agent_urls.get(card.name) != card.url:
                 # Agent URL changed
+                retired.append(self.connectors[card.name])
                 self.connectors[card.name] = AgentConnector(card.name, card.url)
                 self.agent_urls[card.name] = card.url
                 logger.info(f"[Discovery] Agent URL updated: {card.name} -> {card.url}")
@@ -263,10 +309,15 @@ class OrchestratorAgent:
         # Remove agents that are no longer in registry
         removed_agents = set(self.connectors.keys()) - seen_agents
         for agent_name in removed_agents:
-            del self.connectors[agent_name]
+            retired.append(self.connectors.pop(agent_name))
             if agent_name in self.agent_urls:
                 del self.agent_urls[agent_name]
             logger.info(f"[Discovery] Agent removed: {agent_name}")
+        return retired
+    
+    async def aclose(self):
+        """Close every agent connector's HTTP pool (called at server shutdown)."""
+        await asyncio.gather(*(c.close() for c in self.connectors.values()), return_exceptions=True)
     
     async def _rediscover_agents(self):
         """Re-discover agents from registry."""
@@ -274,7 +325,8 @@ class OrchestratorAgent:
             try:
                 logger.info("[Discovery] Re-discovering agents...")
                 agent_cards = await self.discovery_client.list_agent_cards()
-                self._update_connectors(agent_cards)
+                for connector in self._update_connectors(agent_cards):
+                    await connector.close()
                 self.last_discovery_time = time.time()
                 # Clear failed agents set on successful discovery
                 self.failed_agents.clear()
@@ -297,6 +349,23 @@ class OrchestratorAgent:
         discovery_thread.start()
         logger.info(f"[Discovery] Started periodic discovery (every {interval_minutes} minutes)")
 
+    @staticmethod
+    def _reply_text(task) -> str:
+        """
+        Extract the child agent's reply from a completed Task.
+
+        Args:
+            task (Task): Task returned by AgentConnector.send_task().
+
+        Returns:
+            str: Text of the last history entry, or empty string if the agent
+                 did not append a reply.
+        """
+        # History is [user message, ..., agent reply]; fewer than 2 means no reply
+        if task.history and len(task.history) > 1:
+            return task.history[-1].parts[0].text
+        return ""
+
     async def _delegate_task(
         self,
         agent_name: str,
@@ -333,10 +402,7 @@ class OrchestratorAgent:
             task = await self.connectors[agent_name].send_task(message, session_id)
             # Remove from failed agents if successful
             self.failed_agents.discard(agent_name)
-            # Extract the last history entry if present
-            if task.history and len(task.history) > 1:
-                return task.history[-1].parts[0].text
-            return ""
+            return self._reply_text(task)
         except Exception as e:
             # Track failed agent
             self.failed_agents.add(agent_name)
@@ -352,15 +418,73 @@ class OrchestratorAgent:
                     try:
                         task = await self.connectors[agent_name].send_task(message, session_id)
                         self.failed_agents.discard(agent_name)
-                        if task.history and len(task.history) > 1:
-                            return task.history[-1].parts[0].text
-                        return ""
+                        return self._reply_text(task)
                     except Exception as retry_error:
                         logger.error(f"[Discovery] Agent '{agent_name}' still failing after re-discovery: {retry_error}")
                         raise retry_error
             
             raise e
 
+    async def _delegate_tasks(
+        self,
+        agent_names: list[str],
+        messages: list[str],
+        tool_context: ToolContext
+    ) -> list[str]:
+        """
+        A2A tool: sends one message to each of several child agents concurrently.
+
+        Args:
+            agent_names (list[str]): Names of the target agents.
+            messages (list[str]): Message for each agent, in the same order as agent_names.
+            tool_context (ToolContext): Holds state across invocations (e.g., session ID).
+
+        Returns:
+            list[str]: Each agent's reply, in the order given; a failed agent
+                 yields an error line instead of failing the whole batch.
+        """
+        if len(agent_names) != len(messages):
+            raise ValueError("agent_names and messages must have the same length")
+        # Fix the session up front so the concurrent calls can't each create one
+        if "session_id" not in tool_context.state:
+            tool_context.state["session_id"] = str(uuid.uuid4())
+        # Independent child calls: overlap their latencies instead of summing them
+        results = await asyncio.gather(
+            *(self._delegate_task(name, msg, tool_context) for name, msg in zip(agent_names, messages)),
+            return_exceptions=True,
+        )
+        return [
+            f"Error from {name}: {result}" if isinstance(result, Exception) else result
+            for name, result in zip(agent_names, results)
+        ]
+
+    async def _ensure_session(self, session_id: str) -> None:
+        """
+        Create the ADK session for session_id the first time it is seen.
+
+        InMemorySessionService.get_session deep-copies the whole event history,
+        and the Runner fetches the session itself on every run, so only consult
+        the service for IDs this orchestrator has not created yet.
+
+        Args:
+            session_id (str): Session identifier to group related calls.
+        """
+        if session_id in self._known_sessions:
+            return
+        session = await self._runner.session_service.get_session(
+            app_name=self._agent.name,
+            user_id=self._user_id,
+            session_id=session_id
+        )
+        if session is None:
+            await self._runner.session_service.create_session(
+                app_name=self._agent.name,
+                user_id=self._user_id,
+                session_id=session_id,
+                state={}
+            )
+        self._known_sessions.add(session_id)
+
     async def invoke(self, query: str, session_id: str) -> str:
         """
         Primary entrypoint: handles a user query.
@@ -384,19 +508,8 @@ class OrchestratorAgent:
         https://github.com/google/adk-python/commit/1804ca39a678433293158ec066d44c30eeb8e23b
 
         """
-        # 1) Get or create a session for this user and session_id
-        session = await self._runner.session_service.get_session(
-            app_name=self._agent.name,
-            user_id=self._user_id,
-            session_id=session_id
-        )
-        if session is None:
-            session = await self._runner.session_service.create_session(
-                app_name=self._agent.name,
-                user_id=self._user_id,
-                session_id=session_id,
-                state={}
-            )
+        # 1) Make sure a session exists for this user and session_id
+        await self._ensure_session(session_id)
         # 2) Wrap user text into Content object for Gemini
         content = types.Content(
             role="user",
@@ -406,7 +519,7 @@ class OrchestratorAgent:
         last_event = None
         async for event in self._runner.run_async(
             user_id=self._user_id,
-            session_id=session.id,
+            session_id=session_id,
             new_message=content
         ):
             last_event = event
@@ -418,6 +531,57 @@ class OrchestratorAgent:
         # 📤 Extract and join all text responses into one string
         return "\n".join([p.text for p in last_event.content.parts if p.text])
 
+    async def stream(self, query: str, session_id: str) -> AsyncIterator[dict]:
+        """
+        Streaming variant of invoke(): yields progress as the Runner emits events.
+
+        Yields a {"type": "status", ...} dict each time the LLM calls a tool (e.g.
+        delegates to a child agent) and, as the reply is generated, status dicts
+        carrying the text so far. Ends with a {"type": "text", ...} dict holding
+        the same joined text invoke() would have returned.
+
+        Args:
+            query (str): The user's message.
+            session_id (str): Session identifier to group related calls.
+        """
+        await self._ensure_session(session_id)
+        content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=query)]
+        )
+        # 🚀 Forward tool calls as they happen instead of waiting for the final event.
+        # SSE streaming mode also emits partial events with the reply's text chunks.
+        last_event = None
+        partial_text = ""
+        async for event in self._runner.run_async(
+            user_id=self._user_id,
+            session_id=session_id,
+            new_message=content,
+            run_config=STREAMING_RUN_CONFIG
+        ):
+            if event.partial:
+                # Relay the reply as it grows; the UI replaces a status message in place
+                chunk = "".join(p.text for p in (event.content.parts if event.content else []) if p.text)
+                if chunk:
+                    partial_text += chunk
+                    yield {"type": "status", "agent": "orchestrator", "content": partial_text}
+                continue
+            partial_text = ""                   # A complete event closes the current chunk run
+            last_event = event
+            for call in event.get_function_calls():
+                args = call.args or {}
+                target = args.get("agent_name") or ", ".join(args.get("agent_names") or []) or call.name
+                yield {
+                    "type": "status",
+                    "agent": "orchestrator",
+                    "content": f"Consulting {target}..."
+                }
+
+        text = ""
+        if last_event and last_event.content and last_event.content.parts:
+            text = "\n".join([p.text for p in last_event.content.parts if p.text])
+        yield {"type": "text", "agent": "orchestrator", "content": text}
+
 
 class OrchestratorTaskManager(InMemoryTaskManager):
     """
@@ -462,3 +626,31 @@ class OrchestratorTaskManager(InMemoryTaskManager):
             task.history.append(msg)
         # Return the RPC response including the updated task
         return SendTaskResponse(id=request.id, result=task)
+
+    async def handle_send_task_streaming(self, request: SendTaskRequest) -> AsyncIterator[dict]:
+        """
+        Streaming `tasks/send` used by SSEServer's /stream route:
+          1) Store incoming message in memory
+          2) Relay orchestrator progress events as they arrive
+          3) Append the reply, mark task COMPLETED, emit the "complete" event
+        """
+        logger.info(f"OrchestratorTaskManager streaming task {request.params.id}")
+        task = await self.upsert_task(request.params)
+        user_text = self._get_user_text(request)
+        reply_text = ""
+        async for event in self.agent.stream(user_text, request.params.sessionId):
+            if event["type"] == "text":
+                reply_text = event["content"]
+            else:
+                yield event
+        # Record the reply exactly as on_send_task does
+        msg = Message(role="agent", parts=[TextPart(text=reply_text)])
+        async with self.lock:
+            task.status = TaskStatus(state=TaskState.COMPLETED)
+            task.history.append(msg)
+        yield {
+            "type": "complete",
+            "agent": "orchestrator",
+            "content": reply_text or "No response",
+            "result": task.model_dump(mode="json")
+        }
@@ -16,10 +16,6 @@ load_dotenv()
 # A2A server infrastructure
 from server.server import A2AServer
 
-# Agent components
-from agents.live_events_agent.agent import LiveEventsAgent
-from agents.live_events_agent.task_manager import LiveEventsTaskManager
-
 # Agent metadata
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
 
@@ -104,6 +100,10 @@ def main():
     logger.info("Starting Live Events Agent...")
     
     try:
+        # Imported after option parsing so `--help` stays fast
+        from agents.live_events_agent.agent import LiveEventsAgent
+        from agents.live_events_agent.task_manager import LiveEventsTaskManager
+
         # Create the agent and task manager
         agent = LiveEventsAgent()
         task_manager = LiveEventsTaskManager(agent)
@@ -60,6 +60,7 @@ class LiveEventsAgent:
             if tool.name == "get_upcoming_events":
                 self.live_events_tools.append(tool)
                 logger.info(f"Loaded MCP tool: {tool.name}")
+        self.mcp_tools = self.live_events_tools  # Spawned at startup by A2AServer
         
         self.agent = self._build_agent()
         self.user_id = "live_events_user"
@@ -119,15 +120,6 @@ class LiveEventsAgent:
             "- Consider event timing relative to flight booking patterns\n"
             "- Group similar events (e.g., multi-day festivals, concert series)\n\n"
             
-            f"DATE HANDLING:\n"
-            f"- Today is {today.strftime('%A, %B %d, %Y')} ({today.strftime('%Y-%m-%d')})\n"
-            f"- When users ask about 'next month' or 'this weekend', calculate from today's date\n"
-            f"- Always use ISO 8601 format for the MCP tool: YYYY-MM-DDTHH:MM:SSZ\n"
-            f"- For 'next month', use the 1st day of next month at 00:00:00Z to last day at 23:59:59Z\n"
-            f"- For 'this weekend', use upcoming Saturday 00:00:00Z to Sunday 23:59:59Z\n"
-            f"- For 'tomorrow', use tomorrow's date at 00:00:00Z to 23:59:59Z\n"
-            f"- Default to searching 30 days ahead if no specific dates given\n\n"
-            
             "QUANTITATIVE OUTPUT REQUIREMENTS:\n"
             "- Always lead with specific numbers: 'Found 47 events', '12 major festivals'\n"
             "- Show attendance figures: '75,000 expected attendees', 'Venue capacity: 20,000'\n"
@@ -155,6 +147,18 @@ class LiveEventsAgent:
             
             "Remember: You're United Airlines' event intelligence specialist. Focus on events that "
             "specifically impact United's routes, hubs, and competitive position."
+            
+            # Date-dependent rules go last; the static text above stays
+            # byte-identical across calls
+            "\n\n"
+            f"DATE HANDLING:\n"
+            f"- Today is {today.strftime('%A, %B %d, %Y')} ({today.strftime('%Y-%m-%d')})\n"
+            f"- When users ask about 'next month' or 'this weekend', calculate from today's date\n"
+            f"- Always use ISO 8601 format for the MCP tool: YYYY-MM-DDTHH:MM:SSZ\n"
+            f"- For 'next month', use the 1st day of next month at 00:00:00Z to last day at 23:59:59Z\n"
+            f"- For 'this weekend', use upcoming Saturday 00:00:00Z to Sunday 23:59:59Z\n"
+            f"- For 'tomorrow', use tomorrow's date at 00:00:00Z to 23:59:59Z\n"
+            f"- Default to searching 30 days ahead if no specific dates given\n"
             )
         
         # Create and return the LlmAgent
@@ -22,10 +22,6 @@ from server.server import A2AServer
 # Models for describing agent capabilities and metadata
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
 
-# Task manager and agent logic
-from agents.web_scraping_agent.task_manager import AgentTaskManager
-from agents.web_scraping_agent.agent import WebScrapingAgent
-
 # CLI and logging support
 import click           # For creating a clean command-line interface
 import logging         # For logging errors and info to the console
@@ -52,6 +48,10 @@ def main(host, port):
     You can run it via: `python -m agents.google_adk --host 0.0.0.0 --port 12345`
     """
 
+    # Imported after option parsing so `--help` stays fast
+    from agents.web_scraping_agent.task_manager import AgentTaskManager
+    from agents.web_scraping_agent.agent import WebScrapingAgent
+
     # Define what this agent can do – in this case, it does NOT support streaming
     capabilities = AgentCapabilities(streaming=False)
 
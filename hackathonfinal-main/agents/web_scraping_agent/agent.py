@@ -51,6 +51,11 @@ class WebScrapingAgent:
     # This agent only supports plain text input/output
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
 
+    # MCP tools from the fetch and playwright servers that this agent uses
+    WEB_TOOL_NAMES = frozenset({
+        "fetch", "navigate", "screenshot", "click", "fill", "get_text", "evaluate", "get_page_info"
+    })
+
     def __init__(self):
         """
         👷 Initialize the WebScrapingAgent:
@@ -65,9 +70,10 @@ class WebScrapingAgent:
         # Find web scraping tools (fetch and playwright)
         self.web_tools = []
         for tool in mcp_tools:
-            if tool.name in ["fetch", "navigate", "screenshot", "click", "fill", "get_text", "evaluate", "get_page_info"]:
+            if tool.name in self.WEB_TOOL_NAMES:
                 self.web_tools.append(tool)
                 logger.info(f"Loaded MCP tool: {tool.name}")
+        self.mcp_tools = self.web_tools  # Spawned at startup by A2AServer
         
         self._agent = self._build_agent()  # Set up the Gemini agent
         self._user_id = "web_scraping_user"  # Use a fixed user ID for simplicity
@@ -130,10 +136,6 @@ class WebScrapingAgent:
         return (
             "You are a powerful Web Scraping agent with browser automation and content fetching capabilities.\n\n"
             
-            f"CURRENT CONTEXT:\n"
-            f"- Today is {today.strftime('%A, %B %d, %Y')} ({today.strftime('%Y-%m-%d')})\n"
-            f"- Current time is available via get_current_time() tool\n\n"
-            
             "CORE CAPABILITIES:\n"
             "1. Simple Web Fetching (fetch tool):\n"
             "   - fetch(url): Quick HTTP GET requests to retrieve web content\n"
@@ -182,11 +184,15 @@ class WebScrapingAgent:
             "- Show comparison data: 'Price changed by +$12 (5%) since last scrape'\n"
             "- Quantify completeness: 'Coverage: 87% of product catalog (1,043/1,200 items)'\n\n"
             
+            "Remember: You're a sophisticated web scraping assistant with both simple fetch and advanced browser automation capabilities."
+            
+            # Time context last so the unchanging instructions form a reusable prefix
+            "\n\n"
             f"CONTEXT:\n"
+            f"- Today is {today.strftime('%A, %B %d, %Y')} ({today.strftime('%Y-%m-%d')})\n"
             f"- Current time: {today.strftime('%I:%M %p on %A, %B %d, %Y')}\n"
-            f"- Use timestamps when logging scraping activities\n\n"
-            
-            "Remember: You're a sophisticated web scraping assistant with both simple fetch and advanced browser automation capabilities."
+            f"- Current time is available via get_current_time() tool\n"
+            f"- Use timestamps when logging scraping activities\n"
         )
 
     async def invoke(self, query: str, session_id: str) -> str:
@@ -240,13 +246,47 @@ class WebScrapingAgent:
 
     async def stream(self, query: str, session_id: str):
         """
-        🌀 Simulates a "streaming" agent that returns a single reply.
-        This is here just to demonstrate that streaming is possible.
+        🌀 Streaming variant of invoke(): yields progress while the Runner works
+        instead of waiting for the whole scrape to finish.
 
         Yields:
-            dict: Response payload that says the task is complete and gives the time
+            dict: {"is_task_complete": False, "content": ...} for each tool call
+                  (fetch, navigate, ...), then {"is_task_complete": True, "content": ...}
+                  with the same text invoke() would have returned
         """
-        yield {
-            "is_task_complete": True,
-            "content": f"The current time is: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        }
+        session = await self._runner.session_service.get_session(
+            app_name=self._agent.name,
+            user_id=self._user_id,
+            session_id=session_id
+        )
+        if session is None:
+            session = await self._runner.session_service.create_session(
+                app_name=self._agent.name,
+                user_id=self._user_id,
+                session_id=session_id,
+                state={}
+            )
+
+        content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=query)]
+        )
+
+        # 🚀 Forward each tool call as it happens
+        last_event = None
+        async for event in self._runner.run_async(
+            user_id=self._user_id,
+            session_id=session.id,
+            new_message=content
+        ):
+            last_event = event
+            for call in event.get_function_calls():
+                yield {
+                    "is_task_complete": False,
+                    "content": f"Running {call.name}..."
+                }
+
+        text = ""
+        if last_event and last_event.content and last_event.content.parts:
+            text = "\n".join([p.text for p in last_event.content.parts if p.text])
+        yield {"is_task_complete": True, "content": text}
@@ -16,6 +16,7 @@
 # -----------------------------------------------------------------------------
 
 import json
+import logging                              # Request dumps go to the debug log instead of stdout
 from uuid import uuid4                                 # Used to encode/decode JSON data
 import httpx                                # Async HTTP client for making web requests
 from httpx_sse import connect_sse           # SSE client extension for httpx (not used currently)
@@ -31,6 +32,15 @@ from models.json_rpc import JSONRPCRequest
 from models.task import Task, TaskSendParams
 from models.agent import AgentCard
 
+# One keep-alive pool per event loop, closed when the loop changes
+from utilities.http_pool import LoopBoundClient
+
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive pool shared by every request this client sends to its agent
+CONNECTION_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
 
 # -----------------------------------------------------------------------------
 # Custom Error Classes
@@ -62,6 +72,9 @@ class A2AClient:
         else:
             raise ValueError("Must provide either agent_card or url")
 
+        # Pooled HTTP client, created lazily inside the event loop that uses it
+        self._http = LoopBoundClient(timeout=300, limits=CONNECTION_LIMITS)
+
 
     # -------------------------------------------------------------------------
     # send_task: Send a new task to the agent
@@ -73,8 +86,10 @@ class A2AClient:
             params=TaskSendParams(**payload)  # ✅ Proper model wrapping
         )
 
-        print("\n📤 Sending JSON-RPC request:")
-        print(json.dumps(request.model_dump(), indent=2))
+        # The orchestrator sends every delegation through here; only pay for the
+        # pretty-printed dump (and a blocking terminal write) when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📤 Sending JSON-RPC request:\n%s", json.dumps(request.model_dump(), indent=2))
 
         response = await self._send_request(request)
         return Task(**response["result"])  # ✅ Extract just the 'result' field
@@ -91,22 +106,37 @@ class A2AClient:
 
 
 
+    # -------------------------------------------------------------------------
+    # _get_http_client: Reuse one keep-alive connection pool per event loop
+    # -------------------------------------------------------------------------
+    def _get_http_client(self) -> httpx.AsyncClient:
+        return self._http.get()
+
+
+
+    # -------------------------------------------------------------------------
+    # close: Release the pooled connections
+    # -------------------------------------------------------------------------
+    async def close(self):
+        await self._http.aclose()
+
+
+
     # -------------------------------------------------------------------------
     # _send_request: Internal helper to send a JSON-RPC request
     # -------------------------------------------------------------------------
     async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.url,
-                    json=request.model_dump(),  # Convert Pydantic model to JSON
-                    timeout=300
-                )
-                response.raise_for_status()     # Raise error if status code is 4xx/5xx
-                return response.json()          # Return parsed response as a dict
-
-            except httpx.HTTPStatusError as e:
-                raise A2AClientHTTPError(e.response.status_code, str(e)) from e
-
-            except json.JSONDecodeError as e:
-                raise A2AClientJSONError(str(e)) from e
+        client = self._get_http_client()
+        try:
+            response = await client.post(
+                self.url,
+                json=request.model_dump()       # Convert Pydantic model to JSON
+            )
+            response.raise_for_status()         # Raise error if status code is 4xx/5xx
+            return response.json()              # Return parsed response as a dict
+
+        except httpx.HTTPStatusError as e:
+            raise A2AClientHTTPError(e.response.status_code, str(e)) from e
+
+        except json.JSONDecodeError as e:
+            raise A2AClientJSONError(str(e)) from e
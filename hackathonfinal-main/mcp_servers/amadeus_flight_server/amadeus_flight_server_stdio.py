@@ -21,6 +21,8 @@ import httpx
 import os
 from dotenv import load_dotenv
 
+from ttl_cache import TTLCache  # Sibling module; uv runs the server from this directory
+
 # Load environment variables
 load_dotenv()
 
@@ -43,6 +45,25 @@ AMADEUS_API_SECRET = os.getenv("AMADEUS_API_SECRET")
 AMADEUS_AUTH_URL = "https://test.api.amadeus.com/v1/security/oauth2/token"
 AMADEUS_API_BASE = "https://test.api.amadeus.com"
 
+# Identical Amadeus queries within this window are answered from memory,
+# sparing the (rate-limited) API a repeat round trip
+RESPONSE_CACHE_TTL = 300  # seconds
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Static fallback text for endpoints that are not available on the free tier
+AIRLINE_ROUTES_NOTE = (
+    "Note: This endpoint may require enterprise access.\n"
+    "For United Airlines (UA), major routes include:\n"
+    "- Domestic hubs: ORD, DEN, IAH, EWR, SFO, IAD, LAX\n"
+    "- International: LHR, NRT, FRA, SYD, GRU, PVG\n"
+)
+ON_TIME_PERFORMANCE_MOCK = (
+    "Note: Historical performance data (mock):\n"
+    "- On-time departure rate: 78%\n"
+    "- Average delay: 12 minutes\n"
+    "- Weather-related delays: 15%\n"
+)
+
 
 class AmadeusClient:
     """Client for interacting with Amadeus Self-Service APIs."""
@@ -53,6 +74,8 @@ class AmadeusClient:
         self.access_token = None
         self.token_expiry = None
         self.client = httpx.AsyncClient(timeout=30.0)
+        # (endpoint, normalized params) -> response, dropped after RESPONSE_CACHE_TTL
+        self._cache = TTLCache(RESPONSE_CACHE_TTL, RESPONSE_CACHE_MAX_ENTRIES)
     
     async def authenticate(self):
         """Get OAuth2 access token from Amadeus."""
@@ -82,6 +105,12 @@ class AmadeusClient:
     
     async def make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Optional[Dict]:
         """Make authenticated request to Amadeus API."""
+        # Sorted JSON makes the key independent of parameter order
+        key = (endpoint, json.dumps(params or {}, sort_keys=True, default=str))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
         await self.ensure_authenticated()
         
         if not self.access_token:
@@ -95,7 +124,9 @@ class AmadeusClient:
                 params=params
             )
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            self._cache.put(key, data)  # Only successful responses are cached
+            return data
         except httpx.HTTPStatusError as e:
             logging.error(f"API request failed: {e.response.status_code} - {e.response.text}")
             return {"error": f"API error: {e.response.status_code}"}
@@ -348,22 +379,26 @@ async def handle_call_tool(
                 return [types.TextContent(type="text", text=f"Error: {result['error']}")]
             
             # Format the response
-            response = "Flight Offers Search Results:\n\n"
+            parts = ["Flight Offers Search Results:\n\n"]
             if "data" in result and result["data"]:
+                append = parts.append  # Hoisted - called once per segment line
                 for i, offer in enumerate(result["data"][:5], 1):  # Show top 5
-                    response += f"Option {i}:\n"
-                    response += f"Price: ${offer['price']['total']} {offer['price'].get('currency', 'USD')}\n"
+                    price = offer["price"]
+                    append(f"Option {i}:\nPrice: ${price['total']} {price.get('currency', 'USD')}\n")
                     
-                    # Show itinerary
+                    # Show itinerary - one lookup per nested dict, one string per segment
                     for itinerary in offer.get("itineraries", []):
                         for segment in itinerary.get("segments", []):
-                            response += f"- {segment['departure']['iataCode']} → "
-                            response += f"{segment['arrival']['iataCode']} "
-                            response += f"({segment['carrierCode']} {segment['number']})\n"
-                            response += f"  Departure: {segment['departure']['at']}\n"
-                    response += "\n"
+                            departure = segment["departure"]
+                            append(
+                                f"- {departure['iataCode']} → {segment['arrival']['iataCode']} "
+                                f"({segment['carrierCode']} {segment['number']})\n"
+                                f"  Departure: {departure['at']}\n"
+                            )
+                    append("\n")
             else:
-                response += "No flight offers found for this route."
+                parts.append("No flight offers found for this route.")
+            response = "".join(parts)
             
             return [types.TextContent(type="text", text=response)]
         
@@ -417,11 +452,7 @@ async def handle_call_tool(
         elif name == "airline-routes":
             # Get airline routes - Note: This endpoint might not be in free tier
             # Using a mock response for demonstration
-            response = f"Airline Routes for {arguments['airlineCode']}:\n\n"
-            response += "Note: This endpoint may require enterprise access.\n"
-            response += "For United Airlines (UA), major routes include:\n"
-            response += "- Domestic hubs: ORD, DEN, IAH, EWR, SFO, IAD, LAX\n"
-            response += "- International: LHR, NRT, FRA, SYD, GRU, PVG\n"
+            response = f"Airline Routes for {arguments['airlineCode']}:\n\n{AIRLINE_ROUTES_NOTE}"
             
             return [types.TextContent(type="text", text=response)]
         
@@ -465,11 +496,7 @@ async def handle_call_tool(
             
             if "error" in result:
                 # Provide mock data as this endpoint might not be available
-                response = f"On-Time Performance for {arguments['airportCode']}:\n\n"
-                response += "Note: Historical performance data (mock):\n"
-                response += "- On-time departure rate: 78%\n"
-                response += "- Average delay: 12 minutes\n"
-                response += "- Weather-related delays: 15%\n"
+                response = f"On-Time Performance for {arguments['airportCode']}:\n\n{ON_TIME_PERFORMANCE_MOCK}"
                 return [types.TextContent(type="text", text=response)]
             
             # Format actual response if available
@@ -529,4 +556,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
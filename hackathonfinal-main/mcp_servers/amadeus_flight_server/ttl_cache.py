@@ -0,0 +1,46 @@
+"""In-memory TTL response cache for the Amadeus MCP server's API responses."""
+
+import time                           # Monotonic clock for entry ages
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    ⏱️ Maps keys to values that expire `ttl` seconds after they were stored.
+
+    Once `max_entries` is reached the oldest stored entry is evicted (FIFO);
+    re-storing a key moves it to the back of that order.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl (float): Seconds an entry stays valid after it is stored.
+            max_entries (int): Most entries kept before the oldest is evicted.
+            clock (Callable[[], float]): Time source, swappable in tests.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[Hashable, tuple[float, Any]] = {}  # key -> (stored_at, value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value stored under `key`, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self._clock() - stored_at >= self.ttl:
+            del self._entries[key]  # Drop it now rather than waiting for eviction
+            return None
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store `value`, evicting the oldest entry once the cache is full."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (self._clock(), value)
@@ -33,6 +33,9 @@ server = Server("aviation-weather-server")
 # Aviation Weather API base URL
 AVIATION_WEATHER_API = "https://aviationweather.gov/api/data"
 
+# Cap on simultaneous aviationweather.gov requests for one route lookup
+MAX_CONCURRENT_REQUESTS = 4
+
 
 class AviationWeatherClient:
     """Client for fetching aviation weather data from aviationweather.gov API."""
@@ -43,9 +46,10 @@ class AviationWeatherClient:
     
     async def get_metar(self, airport_code: str) -> Optional[str]:
         """Fetch METAR (current weather observation) for an airport."""
+        code = airport_code.upper()  # Normalize once; reused for params and output
         try:
             params = {
-                "ids": airport_code.upper(),
+                "ids": code,
                 "format": "raw",
                 "taf": "false",
                 "hours": 2,
@@ -60,9 +64,9 @@ class AviationWeatherClient:
             
             data = response.text.strip()
             if data:
-                return f"METAR for {airport_code.upper()}:\n{data}"
+                return f"METAR for {code}:\n{data}"
             else:
-                return f"No METAR data available for {airport_code.upper()}"
+                return f"No METAR data available for {code}"
                 
         except Exception as e:
             logging.error(f"Error fetching METAR: {e}")
@@ -70,9 +74,10 @@ class AviationWeatherClient:
     
     async def get_taf(self, airport_code: str) -> Optional[str]:
         """Fetch TAF (Terminal Aerodrome Forecast) for an airport."""
+        code = airport_code.upper()  # Normalize once; reused for params and output
         try:
             params = {
-                "ids": airport_code.upper(),
+                "ids": code,
                 "format": "raw",
                 "metar": "false",
                 "bbox": ""
@@ -86,9 +91,9 @@ class AviationWeatherClient:
             
             data = response.text.strip()
             if data:
-                return f"TAF for {airport_code.upper()}:\n{data}"
+                return f"TAF for {code}:\n{data}"
             else:
-                return f"No TAF data available for {airport_code.upper()}"
+                return f"No TAF data available for {code}"
                 
         except Exception as e:
             logging.error(f"Error fetching TAF: {e}")
@@ -96,11 +101,12 @@ class AviationWeatherClient:
     
     async def get_pireps(self, airport_code: str, radius_nm: int = 50) -> Optional[str]:
         """Fetch PIREPs (Pilot Reports) near an airport."""
+        code = airport_code.upper()  # Normalize once; reused for params and output
         try:
             # Note: The actual API might require different parameters
             # This is a simplified implementation
             params = {
-                "id": airport_code.upper(),
+                "id": code,
                 "distance": radius_nm,
                 "format": "decoded"
             }
@@ -113,9 +119,9 @@ class AviationWeatherClient:
             
             data = response.text.strip()
             if data:
-                return f"PIREPs within {radius_nm}nm of {airport_code.upper()}:\n{data}"
+                return f"PIREPs within {radius_nm}nm of {code}:\n{data}"
             else:
-                return f"No PIREPs found within {radius_nm}nm of {airport_code.upper()}"
+                return f"No PIREPs found within {radius_nm}nm of {code}"
                 
         except Exception as e:
             logging.error(f"Error fetching PIREPs: {e}")
@@ -124,27 +130,39 @@ class AviationWeatherClient:
     async def get_route_weather(self, departure: str, destination: str, alternates: List[str] = None) -> Optional[str]:
         """Get comprehensive weather for a route including departure, destination, and alternates."""
         try:
+            alternates = [alt.upper() for alt in alternates or []]
+            
+            # Run the METAR/TAF requests concurrently, but bounded so a long
+            # alternates list doesn't burst the public API; gather preserves order
+            airports = [departure, destination, *alternates]
+            slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            
+            async def bounded(fetch, code):
+                async with slots:
+                    return await fetch(code)
+            
+            reports = await asyncio.gather(
+                *(bounded(fetch, code) for code in airports for fetch in (self.get_metar, self.get_taf))
+            )
+            
             results = []
             
             # Get METAR and TAF for departure
             results.append("=== DEPARTURE AIRPORT ===")
-            results.append(await self.get_metar(departure))
-            results.append(await self.get_taf(departure))
+            results.extend(reports[0:2])
             results.append("")
             
             # Get METAR and TAF for destination
             results.append("=== DESTINATION AIRPORT ===")
-            results.append(await self.get_metar(destination))
-            results.append(await self.get_taf(destination))
+            results.extend(reports[2:4])
             results.append("")
             
             # Get weather for alternates if provided
             if alternates:
                 results.append("=== ALTERNATE AIRPORTS ===")
-                for alt in alternates:
-                    results.append(f"\n--- {alt.upper()} ---")
-                    results.append(await self.get_metar(alt))
-                    results.append(await self.get_taf(alt))
+                for i, alt in enumerate(alternates, start=2):
+                    results.append(f"\n--- {alt} ---")
+                    results.extend(reports[2 * i:2 * i + 2])
             
             return "\n".join(results)
             
@@ -161,81 +179,86 @@ class AviationWeatherClient:
 weather_client = None
 
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List available tools that the server provides."""
-    return [
-        types.Tool(
-            name="get_metar",
-            description="Returns real-time METAR weather observations updated every 20-60 minutes. Includes wind speed in knots and direction in degrees, visibility in statute miles (0.25-10+ SM), temperature/dewpoint in Celsius, barometric pressure in inches of mercury (29.00-31.00 inHg), cloud coverage at multiple altitudes in feet AGL, and precipitation intensity. Data timestamp accuracy within 5 minutes of observation time.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "airport_code": {
-                        "type": "string",
-                        "description": "ICAO or IATA airport code (e.g., 'KJFK', 'LAX')"
-                    }
-                },
-                "required": ["airport_code"]
-            }
-        ),
-        types.Tool(
-            name="get_taf",
-            description="Returns TAF weather forecasts covering 24-30 hour periods with amendment timestamps. Provides hourly wind speed/gust predictions in knots, visibility forecasts in miles with probability percentages (30-40% PROB groups), expected cloud ceiling heights in hundreds of feet, precipitation type and intensity codes, and temporal change indicators (FM, BECMG, TEMPO) with specific validity periods. Updated 4 times daily (00Z, 06Z, 12Z, 18Z).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "airport_code": {
-                        "type": "string",
-                        "description": "ICAO or IATA airport code (e.g., 'KJFK', 'LAX')"
-                    }
+# Tool definitions are static, so build them once at import instead of on
+# every list_tools request
+WEATHER_TOOLS = (
+    types.Tool(
+        name="get_metar",
+        description="Returns real-time METAR weather observations updated every 20-60 minutes. Includes wind speed in knots and direction in degrees, visibility in statute miles (0.25-10+ SM), temperature/dewpoint in Celsius, barometric pressure in inches of mercury (29.00-31.00 inHg), cloud coverage at multiple altitudes in feet AGL, and precipitation intensity. Data timestamp accuracy within 5 minutes of observation time.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "airport_code": {
+                    "type": "string",
+                    "description": "ICAO or IATA airport code (e.g., 'KJFK', 'LAX')"
+                }
+            },
+            "required": ["airport_code"]
+        }
+    ),
+    types.Tool(
+        name="get_taf",
+        description="Returns TAF weather forecasts covering 24-30 hour periods with amendment timestamps. Provides hourly wind speed/gust predictions in knots, visibility forecasts in miles with probability percentages (30-40% PROB groups), expected cloud ceiling heights in hundreds of feet, precipitation type and intensity codes, and temporal change indicators (FM, BECMG, TEMPO) with specific validity periods. Updated 4 times daily (00Z, 06Z, 12Z, 18Z).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "airport_code": {
+                    "type": "string",
+                    "description": "ICAO or IATA airport code (e.g., 'KJFK', 'LAX')"
+                }
+            },
+            "required": ["airport_code"]
+        }
+    ),
+    types.Tool(
+        name="get_pireps",
+        description="Returns pilot weather reports within specified radius (default 50nm, max 200nm) with report age in minutes (typically 0-120 min old). Includes turbulence intensity on 0-8 scale, icing severity levels (trace/light/moderate/severe), cloud top/base altitudes in feet MSL, wind shear reports with altitude and speed changes, visibility observations, and aircraft type. Typically returns 0-20 reports depending on traffic density.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "airport_code": {
+                    "type": "string",
+                    "description": "ICAO or IATA airport code (e.g., 'KJFK', 'LAX')"
                 },
-                "required": ["airport_code"]
-            }
-        ),
-        types.Tool(
-            name="get_pireps",
-            description="Returns pilot weather reports within specified radius (default 50nm, max 200nm) with report age in minutes (typically 0-120 min old). Includes turbulence intensity on 0-8 scale, icing severity levels (trace/light/moderate/severe), cloud top/base altitudes in feet MSL, wind shear reports with altitude and speed changes, visibility observations, and aircraft type. Typically returns 0-20 reports depending on traffic density.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "airport_code": {
-                        "type": "string",
-                        "description": "ICAO or IATA airport code (e.g., 'KJFK', 'LAX')"
-                    },
-                    "radius_nm": {
-                        "type": "integer",
-                        "description": "Search radius in nautical miles (default: 50)",
-                        "default": 50
-                    }
+                "radius_nm": {
+                    "type": "integer",
+                    "description": "Search radius in nautical miles (default: 50)",
+                    "default": 50
+                }
+            },
+            "required": ["airport_code"]
+        }
+    ),
+    types.Tool(
+        name="get_route_weather",
+        description="Returns complete route weather analysis with 2-4 METARs per airport (covering 2-hour history), current TAFs for all airports (24-30 hour forecasts), and consolidated hazard summary. Provides side-by-side comparison of conditions with crosswind components in knots, runway visual range (RVR) in feet where available, and go/no-go indicators based on approach minimums. Includes up to 3 alternate airports with full weather data. Data compilation time: <2 seconds.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "departure": {
+                    "type": "string",
+                    "description": "Departure airport code (ICAO or IATA)"
                 },
-                "required": ["airport_code"]
-            }
-        ),
-        types.Tool(
-            name="get_route_weather",
-            description="Returns complete route weather analysis with 2-4 METARs per airport (covering 2-hour history), current TAFs for all airports (24-30 hour forecasts), and consolidated hazard summary. Provides side-by-side comparison of conditions with crosswind components in knots, runway visual range (RVR) in feet where available, and go/no-go indicators based on approach minimums. Includes up to 3 alternate airports with full weather data. Data compilation time: <2 seconds.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "departure": {
-                        "type": "string",
-                        "description": "Departure airport code (ICAO or IATA)"
-                    },
-                    "destination": {
-                        "type": "string",
-                        "description": "Destination airport code (ICAO or IATA)"
-                    },
-                    "alternates": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of alternate airport codes (optional)"
-                    }
+                "destination": {
+                    "type": "string",
+                    "description": "Destination airport code (ICAO or IATA)"
                 },
-                "required": ["departure", "destination"]
-            }
-        )
-    ]
+                "alternates": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of alternate airport codes (optional)"
+                }
+            },
+            "required": ["departure", "destination"]
+        }
+    ),
+)
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List available tools that the server provides."""
+    return list(WEATHER_TOOLS)
 
 
 @server.call_tool()
@@ -352,4 +375,10 @@ if __name__ == "__main__":
     print("flight planning or in-flight decision making!", file=sys.stderr)
     print("=" * 50, file=sys.stderr)
     
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
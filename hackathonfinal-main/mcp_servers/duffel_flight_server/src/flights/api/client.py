@@ -1,11 +1,15 @@
 """Duffel API client."""
 
+import asyncio
 import logging
 import httpx
 from typing import Dict, Any, List
 from ..config import get_api_token
 from .endpoints import OfferEndpoints
 
+# Keep-alive pool shared by every Duffel call this client makes
+CONNECTION_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=300)
+
 class DuffelClient:
     """Client for interacting with the Duffel API."""
 
@@ -28,8 +32,41 @@ class DuffelClient:
         self.logger.info(f"API key starts with: {self._token[:8] if self._token else None}")
         self.logger.info(f"Using base URL: {self.base_url}")
 
+        # Pooled HTTP client, created lazily inside the event loop that uses it
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_client_loop = None
+        self._stale_closes: set[asyncio.Task] = set()  # Keeps stale-pool close tasks alive
+
         # Initialize endpoints
-        self.offers = OfferEndpoints(self.base_url, self.headers, self.logger)
+        self.offers = OfferEndpoints(self.base_url, self.headers, self.logger, self._get_http_client)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, rebuilding it if closed or on a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client.is_closed or self._http_client_loop is not loop:
+            stale = self._http_client
+            self._http_client = httpx.AsyncClient(timeout=self.timeout, limits=CONNECTION_LIMITS)
+            self._http_client_loop = loop
+            if stale is not None and not stale.is_closed:
+                # The old pool belongs to a previous loop; release its sockets
+                task = loop.create_task(self._close_quietly(stale))
+                self._stale_closes.add(task)
+                task.add_done_callback(self._stale_closes.discard)
+        return self._http_client
+
+    async def _close_quietly(self, client: httpx.AsyncClient):
+        """Close a pool whose event loop may already be gone."""
+        try:
+            await client.aclose()
+        except Exception as e:
+            self.logger.debug(f"Could not cleanly close a stale HTTP pool: {e!r}")
+
+    async def close(self):
+        """Release the pooled connections."""
+        if self._http_client is not None and not self._http_client.is_closed:
+            await self._close_quietly(self._http_client)
+        self._http_client = None
+        self._http_client_loop = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -37,6 +74,8 @@ class DuffelClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        # The search service re-enters its module-level client on every tool
+        # call, so keep the pool warm here; call close() to release it
         pass
 
     async def create_offer_request(self, **kwargs) -> Dict[str, Any]:
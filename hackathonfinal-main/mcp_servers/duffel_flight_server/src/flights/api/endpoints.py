@@ -1,16 +1,26 @@
 """Duffel API endpoint handlers."""
 
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List
 import logging
 import httpx
 
+# Offer searches fan out to every supplier, so they get a longer budget than the default
+OFFER_REQUEST_TIMEOUT = httpx.Timeout(60.0)
+
 class OfferEndpoints:
     """Offer-related API endpoints."""
     
-    def __init__(self, base_url: str, headers: Dict, logger: logging.Logger):
+    def __init__(
+        self,
+        base_url: str,
+        headers: Dict,
+        logger: logging.Logger,
+        get_client: Callable[[], httpx.AsyncClient]
+    ):
         self.base_url = base_url
         self.headers = headers
         self.logger = logger
+        self.get_client = get_client  # Returns the owning DuffelClient's pooled connection
 
     async def create_offer_request(
         self,
@@ -40,27 +50,27 @@ class OfferEndpoints:
                 "supplier_timeout": supplier_timeout
             }
 
-            async with httpx.AsyncClient(timeout=httpx.Timeout(60.0)) as client:
-                self.logger.info(f"Creating offer request with data: {request_data}")
-                response = await client.post(
-                    f"{self.base_url}/offer_requests",
-                    headers=self.headers,
-                    params=params,
-                    json=request_data
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                request_id = data["data"]["id"]
-                offers = data["data"].get("offers", [])
-                
-                self.logger.info(f"Created offer request with ID: {request_id}")
-                self.logger.info(f"Received {len(offers)} offers")
-                
-                return {
-                    "request_id": request_id,
-                    "offers": offers
-                }
+            self.logger.info(f"Creating offer request with data: {request_data}")
+            response = await self.get_client().post(
+                f"{self.base_url}/offer_requests",
+                headers=self.headers,
+                params=params,
+                json=request_data,
+                timeout=OFFER_REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            request_id = data["data"]["id"]
+            offers = data["data"].get("offers", [])
+            
+            self.logger.info(f"Created offer request with ID: {request_id}")
+            self.logger.info(f"Received {len(offers)} offers")
+            
+            return {
+                "request_id": request_id,
+                "offers": offers
+            }
 
         except Exception as e:
             error_msg = f"Error creating offer request: {str(e)}"
@@ -73,13 +83,12 @@ class OfferEndpoints:
             if not offer_id.startswith("off_"):
                 raise ValueError("Invalid offer ID format - must start with 'off_'")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/offers/{offer_id}",
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self.get_client().get(
+                f"{self.base_url}/offers/{offer_id}",
+                headers=self.headers
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             self.logger.error(f"Error getting offer {offer_id}: {str(e)}")
             raise 
\ No newline at end of file
@@ -21,6 +21,10 @@ logger = logging.getLogger(__name__)
 mcp = FastMCP("find-flights-mcp")
 flight_client = DuffelClient(logger)
 
+# Compact separators: tool output is read by the agent's LLM, not by people,
+# so pretty-printing only adds whitespace to serialize, transfer and tokenize.
+JSON_SEPARATORS = (",", ":")
+
 
 def _create_slice(origin: str, destination: str, date: str, 
                  departure_time: TimeSpec | None = None,
@@ -182,7 +186,7 @@ async def search_flights(params: FlightSearch) -> str:
             
             formatted_response['offers'].append(offer_details)
         
-        return json.dumps(formatted_response, indent=2)
+        return json.dumps(formatted_response, separators=JSON_SEPARATORS)
             
     except Exception as e:
         logger.error(f"Error searching flights: {str(e)}", exc_info=True)
@@ -196,7 +200,7 @@ async def get_offer_details(params: OfferDetails) -> str:
             response = await client.get_offer(
                 offer_id=params.offer_id
             )
-            return json.dumps(response, indent=2)
+            return json.dumps(response, separators=JSON_SEPARATORS)
             
     except Exception as e:
         logger.error(f"Error getting offer details: {str(e)}", exc_info=True)
@@ -273,7 +277,7 @@ async def search_multi_city(params: MultiCityRequest) -> str:
                 
                 formatted_response['offers'].append(offer_details)
             
-            return json.dumps(formatted_response, indent=2)
+            return json.dumps(formatted_response, separators=JSON_SEPARATORS)
             
     except Exception as e:
         logger.error(f"Error searching flights: {str(e)}", exc_info=True)
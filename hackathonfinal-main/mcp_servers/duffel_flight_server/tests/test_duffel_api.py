@@ -1,6 +1,8 @@
 """Tests for Duffel API client."""
 
+import asyncio
 import pytest
+import pytest_asyncio
 import logging
 from datetime import datetime, timedelta
 from flights.api import DuffelClient
@@ -10,12 +12,17 @@ from flights.models.multi_city import MultiCityRequest
 # Setup logging for tests
 logger = logging.getLogger(__name__)
 
-@pytest.fixture
+# Run every test in this module on one event loop so they can share the client
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def client():
-    """Create a test client."""
+    """Create one test client shared by every test in this module."""
     client = DuffelClient(logger)
     async with client as c:
         yield c
+    # Every test ran over the same keep-alive pool; release it once at teardown
+    await client.close()
 
 @pytest.mark.asyncio
 async def test_search_one_way(client):
@@ -102,8 +109,9 @@ async def test_cabin_classes(client):
     
     cabin_classes = ["economy", "premium_economy", "business", "first"]
     
-    for cabin_class in cabin_classes:
-        response = await client.create_offer_request(
+    # The searches are independent, so issue them concurrently
+    responses = await asyncio.gather(*[
+        client.create_offer_request(
             slices=[{
                 "origin": "SFO",
                 "destination": "LAX",
@@ -112,7 +120,10 @@ async def test_cabin_classes(client):
             cabin_class=cabin_class,
             adult_count=1
         )
-        
+        for cabin_class in cabin_classes
+    ])
+    
+    for response in responses:
         assert response is not None
         assert "request_id" in response
         assert "offers" in response
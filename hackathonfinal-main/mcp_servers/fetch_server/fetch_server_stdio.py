@@ -27,6 +27,16 @@ except ImportError as e:
 # Initialize the MCP server
 server = Server("fetch-server")
 
+# Keep-alive pool shared by the robots.txt check and the page fetch
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+# Upper bound on bytes read from one response, so a huge or endless body
+# can't exhaust the server's memory (matches the 10MB the tool advertises)
+MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+
+# Global HTTP client (created in main)
+http_client = None
+
 
 def extract_content_from_html(html_content: str, start_index: int = 0, max_length: int = None) -> str:
     """Extract and convert HTML content to markdown."""
@@ -58,9 +68,8 @@ async def check_may_autonomously_fetch_url(url: str, user_agent: str = "mcp-fetc
     robots_txt_url = get_robots_txt_url(url)
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(robots_txt_url, timeout=10.0)
-            robots_content = response.text if response.status_code == 200 else ""
+        response = await http_client.get(robots_txt_url, timeout=10.0)
+        robots_content = response.text if response.status_code == 200 else ""
         
         if robots_content:
             rp = RobotFileParser()
@@ -90,11 +99,20 @@ async def fetch_url(
     headers = {"User-Agent": user_agent}
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=30.0, follow_redirects=True)
-        
-        response.raise_for_status()
-        content = response.text
+        async with http_client.stream(
+            "GET", url, headers=headers, timeout=30.0, follow_redirects=True
+        ) as response:
+            response.raise_for_status()
+            
+            # Read in chunks and stop at the cap instead of buffering the whole body
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) >= MAX_RESPONSE_BYTES:
+                    del body[MAX_RESPONSE_BYTES:]
+                    break
+            
+            content = body.decode(response.encoding or "utf-8", errors="replace")
         
         if raw:
             if max_length is not None:
@@ -187,21 +205,33 @@ async def handle_call_tool(
 
 async def main():
     """Main entry point for the MCP server."""
-    # Run the server using stdio transport
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="fetch-server",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    global http_client
+    http_client = httpx.AsyncClient(limits=HTTP_LIMITS)
+    
+    try:
+        # Run the server using stdio transport
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="fetch-server",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        await http_client.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
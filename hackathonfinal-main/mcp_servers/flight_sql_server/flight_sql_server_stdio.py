@@ -11,13 +11,10 @@ This server provides access to:
 """
 
 import asyncio
-import json
 import sys
 import logging
 from typing import Any, Optional, List, Dict
-from datetime import datetime
 import os
-from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -33,31 +30,54 @@ except ImportError as e:
     print("Please install MCP: pip install mcp", file=sys.stderr)
     sys.exit(1)
 
-try:
-    from langchain_community.utilities import SQLDatabase
-    from langchain_community.agent_toolkits import SQLDatabaseToolkit
-    from langchain.chat_models import init_chat_model
-    from langchain_core.messages import AIMessage, ToolMessage
-    from langgraph.graph import StateGraph, END, START, MessagesState
-    from langgraph.prebuilt import ToolNode
-except ImportError as e:
-    print(f"LangChain imports failed: {e}", file=sys.stderr)
-    print("Please install dependencies: pip install langchain langchain-community langgraph duckdb", file=sys.stderr)
-    sys.exit(1)
-
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Set SQL_DEBUG=1 to log every graph step and the HTTP/LangGraph internals. Off by
+# default: each question runs several LLM round trips, and echoing all of them to
+# stderr from inside the event loop is pure overhead in normal operation.
+SQL_DEBUG = os.getenv("SQL_DEBUG") == "1"
+if not SQL_DEBUG:
+    for noisy_logger in ("httpx", "langgraph"):
+        logging.getLogger(noisy_logger).setLevel(logging.WARNING)
+
 # Initialize the MCP server
 server = Server("flight-sql-server")
 
 # Database path - adjust this to point to your DuckDB file
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "static.duckdb")
 
+# The database is a static snapshot, so answers can be reused across calls.
+# Set DISABLE_SQL_CACHE=1 to always go to the LLM (e.g. while editing prompts).
+ANSWER_CACHE_ENABLED = os.getenv("DISABLE_SQL_CACHE", "") != "1"
+ANSWER_CACHE_MAX_ENTRIES = 256
+
+# The LLM here picks tools, writes SQL and summarizes rows - short, deterministic
+# output. Greedy decoding and an output cap keep each of the graph's calls fast.
+SQL_LLM_TEMPERATURE = 0
+SQL_LLM_MAX_OUTPUT_TOKENS = 1024
+
 class FlightSQLAnalyzer:
     """Analyzes historical flight pricing and weather data using DuckDB."""
     
+    # Chat model shared by every analyzer in the process; it owns the Gemini
+    # client and its connection pool, so a rebuilt analyzer reuses them
+    _llm = None
+    
+    @classmethod
+    def _get_llm(cls):
+        """Create the SQL-generation chat model on first use and return the shared instance."""
+        if cls._llm is None:
+            from langchain.chat_models import init_chat_model
+            cls._llm = init_chat_model(
+                "gemini-1.5-flash",
+                model_provider="google_genai",
+                temperature=SQL_LLM_TEMPERATURE,
+                max_output_tokens=SQL_LLM_MAX_OUTPUT_TOKENS,
+            )
+        return cls._llm
+    
     def __init__(self):
         """Initialize the SQL analyzer with database connection."""
         self.db_path = f"duckdb:///{DB_PATH}"
@@ -65,16 +85,29 @@ class FlightSQLAnalyzer:
         self.toolkit = None
         self.tools = None
         self.langgraph_agent = None
+        self._answer_cache: Dict[str, str] = {}  # normalized question -> answer
+        self._inflight: Dict[str, asyncio.Future] = {}  # normalized question -> pending answer
         self._initialize_db()
     
     def _initialize_db(self):
         """Initialize database connection and tools."""
+        # LangChain/LangGraph are imported here rather than at module load so the
+        # server can start (and fail fast on a missing database) without paying
+        # for them; Python's module cache makes later imports free.
+        try:
+            from langchain_community.utilities import SQLDatabase
+            from langchain_community.agent_toolkits import SQLDatabaseToolkit
+        except ImportError as e:
+            logger.error(f"LangChain imports failed: {e}")
+            logger.error("Please install dependencies: pip install langchain langchain-community langgraph duckdb")
+            raise
+        
         try:
             # Connect to DuckDB
             self.db = SQLDatabase.from_uri(self.db_path)
             
-            # Initialize LLM - using a lightweight model for SQL generation
-            self.llm = init_chat_model("gemini-1.5-flash", model_provider="google_genai")
+            # Lightweight model for SQL generation, shared at class level
+            self.llm = self._get_llm()
             
             # Create toolkit
             self.toolkit = SQLDatabaseToolkit(db=self.db, llm=self.llm)
@@ -91,13 +124,27 @@ class FlightSQLAnalyzer:
     
     def _build_workflow(self):
         """Build the LangGraph workflow for SQL query generation."""
+        from langchain_core.messages import AIMessage
+        from langgraph.graph import StateGraph, END, START, MessagesState
+        from langgraph.prebuilt import ToolNode
+        
+        # Index the toolkit once instead of scanning the list per lookup
+        tools_by_name = {tool.name: tool for tool in self.tools}
+        
         # Get specific tools
-        get_schema_tool = next(tool for tool in self.tools if tool.name == "sql_db_schema")
+        get_schema_tool = tools_by_name["sql_db_schema"]
         get_schema_node = ToolNode([get_schema_tool], name="get_schema")
         
-        run_query_tool = next(tool for tool in self.tools if tool.name == "sql_db_query")
+        run_query_tool = tools_by_name["sql_db_query"]
         run_query_node = ToolNode([run_query_tool], name="run_query")
         
+        list_tables_tool = tools_by_name["sql_db_list_tables"]
+        
+        # Bind tools to the shared LLM once; the nodes below run on every question
+        schema_llm = self.llm.bind_tools([get_schema_tool], tool_choice="any")
+        query_llm = self.llm.bind_tools([run_query_tool])
+        check_llm = self.llm.bind_tools([run_query_tool], tool_choice="any")
+        
         def list_tables(state: MessagesState):
             tool_call = {
                 "name": "sql_db_list_tables",
@@ -107,7 +154,6 @@ class FlightSQLAnalyzer:
             }
             tool_call_message = AIMessage(content="", tool_calls=[tool_call])
             
-            list_tables_tool = next(tool for tool in self.tools if tool.name == "sql_db_list_tables")
             tool_message = list_tables_tool.invoke(tool_call)
             response = AIMessage(f"Available tables: {tool_message.content}")
             
@@ -117,8 +163,7 @@ class FlightSQLAnalyzer:
             messages = state["messages"]
             while messages and isinstance(messages[-1], AIMessage):
                 messages = messages[:-1]
-            llm_with_tools = self.llm.bind_tools([get_schema_tool], tool_choice="any")
-            response = llm_with_tools.invoke(messages)
+            response = schema_llm.invoke(messages)
             return {"messages": [response]}
         
         generate_query_system_prompt = f"""
@@ -175,8 +220,7 @@ You have access to the following schema:
         
         def generate_query(state: MessagesState):
             system_message = {"role": "system", "content": generate_query_system_prompt}
-            llm_with_tools = self.llm.bind_tools([run_query_tool])
-            response = llm_with_tools.invoke([system_message] + state["messages"])
+            response = query_llm.invoke([system_message] + state["messages"])
             return {"messages": [response]}
         
         check_query_system_prompt = f"""
@@ -191,8 +235,7 @@ Reproduce the correct query if needed.
                 return {"messages": []}
             
             user_message = {"role": "user", "content": tool_call["args"]["query"]}
-            llm_with_tools = self.llm.bind_tools([run_query_tool], tool_choice="any")
-            response = llm_with_tools.invoke([system_message, user_message])
+            response = check_llm.invoke([system_message, user_message])
             response.id = state["messages"][-1].id
             return {"messages": [response]}
         
@@ -230,9 +273,38 @@ Reproduce the correct query if needed.
         Returns:
             Analysis results as a string
         """
+        # Collapse whitespace/case so trivially different phrasings share an entry
+        cache_key = " ".join(question.lower().split())
+        if ANSWER_CACHE_ENABLED and cache_key in self._answer_cache:
+            logger.info(f"Answer cache hit for SQL question: {question}")
+            return self._answer_cache[cache_key]
+        
+        # The cache covers repeats over time; this covers repeats at the same time.
+        # Concurrent callers with the same question wait on the first one's graph run
+        # instead of each driving their own LLM/SQL round trips.
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            logger.info(f"Joining in-flight SQL question: {question}")
+            return await asyncio.shield(pending)  # A cancelled waiter must not cancel the shared run
+        
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = pending
+        try:
+            result = await self._run_sql_question(question, cache_key)
+            pending.set_result(result)
+            return result
+        finally:
+            if not pending.done():
+                # Leader was cancelled. Its waiters weren't, so hand them an ordinary
+                # error (reported by handle_call_tool) rather than a CancelledError
+                pending.set_exception(RuntimeError("SQL analysis was cancelled before it finished; please retry"))
+                pending.exception()  # Mark retrieved so a waiter-less future doesn't log a warning
+            self._inflight.pop(cache_key, None)
+    
+    async def _run_sql_question(self, question: str, cache_key: str) -> str:
+        """Run the LangGraph workflow for one question and cache a successful answer."""
         try:
             final_response = None
-            all_messages = []
             
             logger.info(f"Processing SQL question: {question}")
             
@@ -242,7 +314,8 @@ Reproduce the correct query if needed.
                 stream_mode="values",
             ):
                 msg = step["messages"][-1]
-                all_messages.append(msg)
+                if SQL_DEBUG:
+                    logger.info(f"Graph step:\n{msg.pretty_repr()}")
                 
                 # Keep track of the final response
                 if hasattr(msg, 'content') and msg.content and not hasattr(msg, 'tool_calls'):
@@ -255,9 +328,17 @@ Reproduce the correct query if needed.
             result = final_response.content
             
             # Add some context if it's raw data
-            if result and (result.startswith('[') or result.startswith('(')):
+            if result and result.startswith(('[', '(')):
                 result = f"Query Results:\n{result}"
             
+            # The last message is often a ToolMessage, and a failed query surfaces
+            # there as data ("Error: ...") rather than raising - never cache those
+            failed = getattr(final_response, "status", None) == "error" or result.startswith("Error")
+            if ANSWER_CACHE_ENABLED and result and not failed:
+                if len(self._answer_cache) >= ANSWER_CACHE_MAX_ENTRIES:
+                    self._answer_cache.pop(next(iter(self._answer_cache)))  # Evict oldest entry
+                self._answer_cache[cache_key] = result
+            
             return result
             
         except Exception as e:
@@ -317,95 +398,115 @@ Reproduce the correct query if needed.
         question = f"What was the weather in {city} on {date} and how did it affect flight prices? Show both weather conditions and any price changes."
         return await self.analyze_sql_question(question)
 
-# Create global analyzer instance
-analyzer = FlightSQLAnalyzer()
+# Global analyzer instance - built on first tool call so server startup stays cheap
+analyzer = None
 
-@server.list_tools()
-async def handle_list_tools() -> List[types.Tool]:
-    """List available SQL analysis tools."""
-    return [
-        types.Tool(
-            name="analyze-flight-sql",
-            description="Analyze historical flight pricing and weather data using natural language queries",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "question": {
-                        "type": "string",
-                        "description": "Natural language question about flight prices, routes, or weather impacts"
-                    }
+
+analyzer_lock = asyncio.Lock()
+
+
+async def get_analyzer() -> FlightSQLAnalyzer:
+    """Return the shared analyzer, connecting to DuckDB and the LLM on first use."""
+    global analyzer
+    if analyzer is None:
+        async with analyzer_lock:
+            if analyzer is None:
+                # Opening DuckDB, loading the toolkit and compiling the graph is
+                # blocking work; run it off the event loop so the stdio session
+                # keeps answering while the first call warms up
+                analyzer = await asyncio.to_thread(FlightSQLAnalyzer)
+    return analyzer
+
+# The schemas never change at runtime; validate the Tool models once at import
+# and hand out copies of the same list on each list_tools request
+SQL_TOOLS = (
+    types.Tool(
+        name="analyze-flight-sql",
+        description="Analyze historical flight pricing and weather data using natural language queries",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "question": {
+                    "type": "string",
+                    "description": "Natural language question about flight prices, routes, or weather impacts"
+                }
+            },
+            "required": ["question"]
+        }
+    ),
+    types.Tool(
+        name="get-route-prices",
+        description="Get historical flight prices for a specific route",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "origin_city": {
+                    "type": "string",
+                    "description": "Origin city name (e.g., 'Chicago', 'New York')"
                 },
-                "required": ["question"]
-            }
-        ),
-        types.Tool(
-            name="get-route-prices",
-            description="Get historical flight prices for a specific route",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "origin_city": {
-                        "type": "string",
-                        "description": "Origin city name (e.g., 'Chicago', 'New York')"
-                    },
-                    "destination_city": {
-                        "type": "string",
-                        "description": "Destination city name (e.g., 'London', 'Tokyo')"
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Optional start date in YYYY-MM-DD format"
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "Optional end date in YYYY-MM-DD format"
-                    }
+                "destination_city": {
+                    "type": "string",
+                    "description": "Destination city name (e.g., 'London', 'Tokyo')"
                 },
-                "required": ["origin_city", "destination_city"]
-            }
-        ),
-        types.Tool(
-            name="analyze-price-trends",
-            description="Analyze price trends for a route over time",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "origin_city": {
-                        "type": "string",
-                        "description": "Origin city name"
-                    },
-                    "destination_city": {
-                        "type": "string",
-                        "description": "Destination city name"
-                    },
-                    "time_period": {
-                        "type": "string",
-                        "enum": ["monthly", "weekly", "daily"],
-                        "description": "Time period for grouping (default: monthly)"
-                    }
+                "start_date": {
+                    "type": "string",
+                    "description": "Optional start date in YYYY-MM-DD format"
                 },
-                "required": ["origin_city", "destination_city"]
-            }
-        ),
-        types.Tool(
-            name="check-weather-impact",
-            description="Check weather conditions and their impact on flight prices",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "city": {
-                        "type": "string",
-                        "description": "City name to check weather for"
-                    },
-                    "date": {
-                        "type": "string",
-                        "description": "Date to check in YYYY-MM-DD format"
-                    }
+                "end_date": {
+                    "type": "string",
+                    "description": "Optional end date in YYYY-MM-DD format"
+                }
+            },
+            "required": ["origin_city", "destination_city"]
+        }
+    ),
+    types.Tool(
+        name="analyze-price-trends",
+        description="Analyze price trends for a route over time",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "origin_city": {
+                    "type": "string",
+                    "description": "Origin city name"
                 },
-                "required": ["city", "date"]
-            }
-        )
-    ]
+                "destination_city": {
+                    "type": "string",
+                    "description": "Destination city name"
+                },
+                "time_period": {
+                    "type": "string",
+                    "enum": ["monthly", "weekly", "daily"],
+                    "description": "Time period for grouping (default: monthly)"
+                }
+            },
+            "required": ["origin_city", "destination_city"]
+        }
+    ),
+    types.Tool(
+        name="check-weather-impact",
+        description="Check weather conditions and their impact on flight prices",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "city": {
+                    "type": "string",
+                    "description": "City name to check weather for"
+                },
+                "date": {
+                    "type": "string",
+                    "description": "Date to check in YYYY-MM-DD format"
+                }
+            },
+            "required": ["city", "date"]
+        }
+    ),
+)
+
+@server.list_tools()
+async def handle_list_tools() -> List[types.Tool]:
+    """List available SQL analysis tools."""
+    return list(SQL_TOOLS)
 
 @server.call_tool()
 async def handle_call_tool(
@@ -416,6 +517,8 @@ async def handle_call_tool(
         arguments = {}
     
     try:
+        analyzer = await get_analyzer()
+        
         if name == "analyze-flight-sql":
             result = await analyzer.analyze_sql_question(arguments.get("question", ""))
         elif name == "get-route-prices":
@@ -471,4 +574,10 @@ async def main():
         )
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Stdio framing and the Gemini round trips are loop-bound; run on uvloop if installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
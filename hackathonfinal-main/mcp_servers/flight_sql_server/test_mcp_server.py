@@ -34,10 +34,29 @@ async def test_mcp_server():
             else:
                 print("   Server info not available")
             
+            # Tool discovery and tests 1 and 2 are independent, so issue all three
+            # requests at once; return_exceptions keeps one failure from hiding the rest
+            tools_result, sql_result, prices_result = await asyncio.gather(
+                session.list_tools(),
+                session.call_tool(
+                    "analyze-flight-sql",
+                    {"question": "What cities are in the database?"}
+                ),
+                session.call_tool(
+                    "get-route-prices",
+                    {
+                        "origin_city": "los angeles",
+                        "destination_city": "chicago"
+                    }
+                ),
+                return_exceptions=True,
+            )
+            
             # List available tools
-            tools_result = await session.list_tools()
             print("\n2. Available tools:")
-            if hasattr(tools_result, 'tools'):
+            if isinstance(tools_result, Exception):
+                print(f"   Error: {tools_result}")
+            elif hasattr(tools_result, 'tools'):
                 for tool in tools_result.tools:
                     print(f"   - {tool.name}: {tool.description}")
             else:
@@ -45,35 +64,22 @@ async def test_mcp_server():
             
             # Test 1: Simple SQL question
             print("\n3. Testing analyze-flight-sql tool:")
-            try:
-                result = await session.call_tool(
-                    "analyze-flight-sql",
-                    {"question": "What cities are in the database?"}
-                )
-                if hasattr(result, 'content'):
-                    print(f"   Result: {result.content[0].text if result.content else 'No content'}")
-                else:
-                    print(f"   Result: {result}")
-            except Exception as e:
-                print(f"   Error: {e}")
+            if isinstance(sql_result, Exception):
+                print(f"   Error: {sql_result}")
+            elif hasattr(sql_result, 'content'):
+                print(f"   Result: {sql_result.content[0].text if sql_result.content else 'No content'}")
+            else:
+                print(f"   Result: {sql_result}")
             
             # Test 2: Route prices
             print("\n4. Testing get-route-prices tool:")
-            try:
-                result = await session.call_tool(
-                    "get-route-prices",
-                    {
-                        "origin_city": "los angeles",
-                        "destination_city": "chicago"
-                    }
-                )
-                if hasattr(result, 'content'):
-                    text = result.content[0].text if result.content else 'No content'
-                    print(f"   Result: {text[:200]}...")
-                else:
-                    print(f"   Result: {str(result)[:200]}...")
-            except Exception as e:
-                print(f"   Error: {e}")
+            if isinstance(prices_result, Exception):
+                print(f"   Error: {prices_result}")
+            elif hasattr(prices_result, 'content'):
+                text = prices_result.content[0].text if prices_result.content else 'No content'
+                print(f"   Result: {text[:200]}...")
+            else:
+                print(f"   Result: {str(prices_result)[:200]}...")
             
             print("\n✅ MCP server is running!")
 
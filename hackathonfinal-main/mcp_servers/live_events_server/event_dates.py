@@ -0,0 +1,35 @@
+"""Date helpers shared by the Live Events MCP servers (HTTP and stdio)."""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def normalize_dttm(value: str, end_of_day: bool = False) -> str:
+    """
+    Normalize a caller-supplied date/datetime to Ticketmaster's ISO 8601 format.
+
+    Accepts plain dates ("2025-2-8", "2025-02-08") as well as full ISO datetimes
+    ("2025-02-08T00:00:00Z", "2025-02-08T10:00:00-05:00"), so equivalent inputs
+    always produce the same string. Values carrying an offset are converted to
+    UTC; values without one are taken to already be UTC.
+
+    Args:
+        value: Date or datetime string supplied by the caller
+        end_of_day: If a bare date is given, pin it to 23:59:59 instead of 00:00:00
+
+    Returns:
+        UTC datetime string formatted as YYYY-MM-DDTHH:MM:SSZ
+    """
+    value = value.strip()
+    if "T" not in value and " " not in value:
+        # Bare date - strptime tolerates non zero-padded month/day
+        parsed = datetime.strptime(value, "%Y-%m-%d")
+        if end_of_day:
+            parsed = parsed.replace(hour=23, minute=59, second=59)
+    else:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is not None:
+            # The trailing Z below claims UTC, so shift the wall-clock time to match
+            parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -12,6 +12,9 @@ import httpx
 from pydantic import BaseModel, Field
 from mcp.server.fastmcp import FastMCP
 
+from event_dates import normalize_dttm  # Sibling module; the script's directory is on sys.path
+from ttl_cache import TTLCache
+
 # Load environment variables
 load_dotenv()
 
@@ -31,6 +34,12 @@ class UpcomingEventsRequest(BaseModel):
     )
 
 
+# Listings for a city/date window rarely change within minutes, so identical
+# searches are answered from memory instead of spending Ticketmaster quota
+EVENTS_CACHE_TTL = 600  # seconds
+EVENTS_CACHE_MAX_ENTRIES = 256
+
+
 class EventsApiClient:
     """Client for interacting with the Ticketmaster API."""
     
@@ -39,6 +48,10 @@ class EventsApiClient:
         self.api_key = api_key
         if not self.api_key:
             raise ValueError("Ticketmaster API key missing!")
+        # One pooled client so repeat searches reuse the TLS connection to Ticketmaster
+        self.client = httpx.AsyncClient(timeout=30.0)
+        # (city, start, end, classification, keyword) -> response, dropped after EVENTS_CACHE_TTL
+        self._cache = TTLCache(EVENTS_CACHE_TTL, EVENTS_CACHE_MAX_ENTRIES)
 
     async def fetch_events(
         self,
@@ -49,29 +62,39 @@ class EventsApiClient:
         keyword: Optional[str] = None,
     ) -> Optional[dict]:
         """Fetch events from Ticketmaster API."""
-        async with httpx.AsyncClient() as client:
-            try:
-                params = {
-                    "apikey": self.api_key,
-                    "city": city,
-                    "startDateTime": start_dttm_str,
-                    "endDateTime": end_dttm_str,
-                    "classificationName": classification_name,
-                    "size": 100,
-                }
-                if keyword:
-                    params["keyword"] = keyword
-                    
-                response = await client.get(
-                    f"{self.base_url}/events.json",
-                    params=params,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                logging.error(f"Error fetching events: {e}")
-                return None
+        key = (city.strip().lower(), start_dttm_str, end_dttm_str, classification_name, keyword)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            params = {
+                "apikey": self.api_key,
+                "city": city,
+                "startDateTime": start_dttm_str,
+                "endDateTime": end_dttm_str,
+                "classificationName": classification_name,
+                "size": 100,
+            }
+            if keyword:
+                params["keyword"] = keyword
+                
+            response = await self.client.get(
+                f"{self.base_url}/events.json",
+                params=params,
+            )
+            response.raise_for_status()
+            data = response.json()
+            # Only successful responses are cached; errors are retried next time
+            self._cache.put(key, data)
+            return data
+        except Exception as e:
+            logging.error(f"Error fetching events: {e}")
+            return None
+
+    async def close(self):
+        """Close the HTTP client."""
+        await self.client.aclose()
 
 
 def format_events(response_dict: Optional[dict]) -> str:
@@ -173,6 +196,10 @@ async def get_upcoming_events(
         if not api_client:
             return "Error: API client not initialized. Please check your TICKETMASTER_API_KEY."
         
+        # Normalize once at the boundary so equivalent inputs hit the API identically
+        start_dttm_str = normalize_dttm(start_dttm_str)
+        end_dttm_str = normalize_dttm(end_dttm_str, end_of_day=True)
+        
         response = await api_client.fetch_events(
             city=city,
             start_dttm_str=start_dttm_str,
@@ -187,6 +214,22 @@ async def get_upcoming_events(
         return f"Error fetching events: {str(e)}"
 
 
+async def serve(transport: str):
+    """
+    Run the FastMCP app on `transport`, closing the pooled Ticketmaster client on shutdown.
+
+    FastMCP's own lifespan is entered once per client session, so the shared
+    client is closed here, where the whole server stops, rather than there.
+    """
+    try:
+        if transport == "sse":
+            await app.run_sse_async()
+        else:
+            await app.run_streamable_http_async()
+    finally:
+        await api_client.close()
+
+
 def setup_server_config():
     """Setup server configuration from command line args."""
     parser = argparse.ArgumentParser(description="MCP Live Events Server")
@@ -201,6 +244,12 @@ def setup_server_config():
         default="127.0.0.1",
         help="Host to run server on (default: 127.0.0.1)"
     )
+    parser.add_argument(
+        "--transport",
+        choices=["streamable-http", "sse"],
+        default="streamable-http",
+        help="MCP transport (default: streamable-http, served at /mcp; sse is the legacy /sse endpoint)"
+    )
     
     args = parser.parse_args()
     
@@ -221,8 +270,11 @@ if __name__ == "__main__":
         print(f"Ticketmaster API integration ready")
         print(f"Server starting on {args.host}:{args.port}")
         
-        # Run the server with SSE transport
-        app.run(transport="sse")
+        # Streamable HTTP replaces the deprecated SSE transport: each call is a
+        # plain POST, so idle clients don't hold a stream open that proxies drop
+        app.settings.host = args.host
+        app.settings.port = args.port
+        asyncio.run(serve(args.transport))
         
     except ValueError as e:
         print(f"Configuration error: {e}")
@@ -8,12 +8,14 @@ import asyncio
 import os
 import logging
 from typing import Any, Optional
-from datetime import datetime
 from dotenv import load_dotenv
 
 import httpx
 import sys
 
+from event_dates import normalize_dttm  # Shared with live_events_server.py
+from ttl_cache import TTLCache
+
 # Load environment variables from project root
 load_dotenv()
 
@@ -32,6 +34,12 @@ except ImportError as e:
 server = Server("live-events-server")
 
 
+# Listings for a city/date window rarely change within minutes, so identical
+# searches are answered from memory instead of spending Ticketmaster quota
+EVENTS_CACHE_TTL = 600  # seconds
+EVENTS_CACHE_MAX_ENTRIES = 256
+
+
 class EventsApiClient:
     """Client for interacting with the Ticketmaster API."""
     
@@ -40,6 +48,10 @@ class EventsApiClient:
         self.api_key = api_key
         if not self.api_key:
             raise ValueError("Ticketmaster API key missing!")
+        # One pooled client so repeat searches reuse the TLS connection to Ticketmaster
+        self.client = httpx.AsyncClient(timeout=30.0)
+        # (city, start, end, classification, keyword) -> response, dropped after EVENTS_CACHE_TTL
+        self._cache = TTLCache(EVENTS_CACHE_TTL, EVENTS_CACHE_MAX_ENTRIES)
 
     async def fetch_events(
         self,
@@ -50,29 +62,39 @@ class EventsApiClient:
         keyword: Optional[str] = None,
     ) -> Optional[dict]:
         """Fetch events from Ticketmaster API."""
-        async with httpx.AsyncClient() as client:
-            try:
-                params = {
-                    "apikey": self.api_key,
-                    "city": city,
-                    "startDateTime": start_dttm_str,
-                    "endDateTime": end_dttm_str,
-                    "classificationName": classification_name,
-                    "size": 100,
-                }
-                if keyword:
-                    params["keyword"] = keyword
-                    
-                response = await client.get(
-                    f"{self.base_url}/events.json",
-                    params=params,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                logging.error(f"Error fetching events: {e}")
-                return None
+        key = (city.strip().lower(), start_dttm_str, end_dttm_str, classification_name, keyword)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            params = {
+                "apikey": self.api_key,
+                "city": city,
+                "startDateTime": start_dttm_str,
+                "endDateTime": end_dttm_str,
+                "classificationName": classification_name,
+                "size": 100,
+            }
+            if keyword:
+                params["keyword"] = keyword
+                
+            response = await self.client.get(
+                f"{self.base_url}/events.json",
+                params=params,
+            )
+            response.raise_for_status()
+            data = response.json()
+            # Only successful responses are cached; errors are retried next time
+            self._cache.put(key, data)
+            return data
+        except Exception as e:
+            logging.error(f"Error fetching events: {e}")
+            return None
+
+    async def close(self):
+        """Close the HTTP client."""
+        await self.client.aclose()
 
 
 def format_events(response_dict: Optional[dict]) -> str:
@@ -194,6 +216,10 @@ async def handle_call_tool(
                     text="Error: API client not initialized. Please check your TICKETMASTER_API_KEY."
                 )]
             
+            # Normalize once at the boundary so equivalent inputs hit the API identically
+            start_dttm_str = normalize_dttm(start_dttm_str)
+            end_dttm_str = normalize_dttm(end_dttm_str, end_of_day=True)
+            
             response = await api_client.fetch_events(
                 city=city,
                 start_dttm_str=start_dttm_str,
@@ -233,21 +259,30 @@ async def main():
         print(f"Error initializing API client: {e}", file=sys.stderr)
         sys.exit(1)
     
-    # Run the server using stdio transport
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="live-events-server",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    try:
+        # Run the server using stdio transport
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="live-events-server",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        await api_client.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -29,22 +29,30 @@ browser: Optional[Browser] = None
 context: Optional[BrowserContext] = None
 page: Optional[Page] = None
 
+# Tool calls are dispatched concurrently; without this, two first navigations
+# would each start a driver and launch their own Chromium
+browser_lock = asyncio.Lock()
+
 
 async def ensure_browser(headless: bool = True):
     """Ensure browser is initialized."""
     global playwright_instance, browser, context, page
     
-    if playwright_instance is None:
-        playwright_instance = await async_playwright().start()
-    
-    if browser is None:
-        browser = await playwright_instance.chromium.launch(headless=headless)
+    if page is not None:
+        return  # Fast path: everything is already up
     
-    if context is None:
-        context = await browser.new_context()
-    
-    if page is None:
-        page = await context.new_page()
+    async with browser_lock:
+        if playwright_instance is None:
+            playwright_instance = await async_playwright().start()
+        
+        if browser is None:
+            browser = await playwright_instance.chromium.launch(headless=headless)
+        
+        if context is None:
+            context = await browser.new_context()
+        
+        if page is None:
+            page = await context.new_page()
 
 
 @server.list_tools()
@@ -374,4 +382,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Browser driver traffic is pure async I/O, so take uvloop's loop when available
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -5,7 +5,10 @@ A simple Model Context Protocol server that provides shell command execution too
 """
 
 import asyncio
-import subprocess
+import os
+import stat
+from asyncio.subprocess import PIPE
+from datetime import datetime
 from typing import Any
 
 import sys
@@ -25,6 +28,52 @@ except ImportError as e:
 server = Server("terminal-server")
 
 
+async def communicate(proc: asyncio.subprocess.Process, timeout: float) -> tuple[str, str]:
+    """Wait for a subprocess without blocking the event loop, killing it on timeout."""
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+def format_stat(name: str, path: str, info: os.stat_result) -> str:
+    """Render one lstat result as an `ls -l` style line."""
+    modified = datetime.fromtimestamp(info.st_mtime).strftime("%Y-%m-%d %H:%M")
+    if stat.S_ISLNK(info.st_mode):  # Answer from the lstat rather than asking again
+        name += f" -> {os.readlink(path)}"
+    return (
+        f"{stat.filemode(info.st_mode)} {info.st_nlink:>3} {info.st_uid:>5} {info.st_gid:>5} "
+        f"{info.st_size:>10} {modified} {name}"
+    )
+
+
+def format_entry(entry: os.DirEntry) -> str:
+    """Render one directory entry, or an error line if it can't be read (as ls does)."""
+    try:
+        # lstat, like ls; cached on some platforms
+        return format_stat(entry.name, entry.path, entry.stat(follow_symlinks=False))
+    except OSError as e:  # Vanished mid-listing, permission denied, unreadable link...
+        return f"?????????? {entry.name} (cannot access: {e.strerror or e})"
+
+
+def list_directory(path: str) -> str:
+    """
+    List a directory in-process with os.scandir instead of forking `ls -la`.
+
+    Like `ls -la FILE`, a path to a file lists just that file. A missing path
+    raises FileNotFoundError for the caller to report.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except NotADirectoryError:
+        return "1 entry\n" + format_stat(path, path, os.lstat(path))
+    return f"{len(entries)} entries\n" + "\n".join(format_entry(entry) for entry in entries)
+
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available tools that the server provides."""
@@ -83,23 +132,18 @@ async def handle_call_tool(
         
         try:
             # Execute the command with timeout
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            proc = await asyncio.create_subprocess_shell(command, stdout=PIPE, stderr=PIPE)
+            stdout, stderr = await communicate(proc, timeout)
             
             output = f"Command: {command}\n"
-            output += f"Exit Code: {result.returncode}\n"
-            output += f"STDOUT:\n{result.stdout}\n"
-            if result.stderr:
-                output += f"STDERR:\n{result.stderr}\n"
+            output += f"Exit Code: {proc.returncode}\n"
+            output += f"STDOUT:\n{stdout}\n"
+            if stderr:
+                output += f"STDERR:\n{stderr}\n"
                 
             return [types.TextContent(type="text", text=output)]
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return [types.TextContent(
                 type="text", 
                 text=f"Error: Command '{command}' timed out after {timeout} seconds"
@@ -114,23 +158,12 @@ async def handle_call_tool(
         path = arguments.get("path", ".") if arguments else "."
         
         try:
-            result = subprocess.run(
-                ["ls", "-la", path],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                return [types.TextContent(
-                    type="text",
-                    text=f"Directory listing for {path}:\n{result.stdout}"
-                )]
-            else:
-                return [types.TextContent(
-                    type="text", 
-                    text=f"Error listing directory {path}: {result.stderr}"
-                )]
+            # Filesystem calls can stall on slow mounts, so keep them off the event loop
+            listing = await asyncio.to_thread(list_directory, path)
+            return [types.TextContent(
+                type="text",
+                text=f"Directory listing for {path}:\n{listing}"
+            )]
                 
         except Exception as e:
             return [types.TextContent(
@@ -164,4 +197,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Command runs and directory listings are all awaited I/O; prefer uvloop when present
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -24,12 +24,21 @@ from models.agent import AgentCard                      # Describes the agent's
 from models.request import A2ARequest, SendTaskRequest  # Request models for tasks
 from models.json_rpc import JSONRPCResponse, InternalError  # JSON-RPC utilities for structured messaging
 from server import task_manager              # Our actual task handling logic (Gemini agent)
+from utilities.mcp.mcp_connect import prewarm_tools  # Spawns an agent's MCP servers ahead of the first request
 
 # 🛠️ General utilities
+import asyncio                                           # Used to run the agent warm-up in the background
+from contextlib import asynccontextmanager               # Used to build the Starlette lifespan handler
+import os                                                # Used to read the debug toggle from the environment
+import importlib.util                                    # Used to probe for optional packages without importing them
 import json                                              # Used for printing the request payloads (for debugging)
 import logging                                           # Used to log errors and info messages
 logger = logging.getLogger(__name__)                     # Setup logger for this file
 
+# 🐞 Set A2A_DEBUG=1 to echo every incoming payload (off by default: the
+#    pretty-printed dump runs on every request and can be large)
+DEBUG_PAYLOADS = os.getenv("A2A_DEBUG") == "1"
+
 # 🕒 datetime import for serialization
 from datetime import datetime
 
@@ -50,6 +59,25 @@ def json_serializer(obj):
     raise TypeError(f"Type {type(obj)} not serializable")
 
 
+# -----------------------------------------------------------------------------
+# ⚡ Event loop selection for uvicorn
+# -----------------------------------------------------------------------------
+def uvicorn_loop_options() -> dict:
+    """
+    Pick uvloop and httptools for uvicorn when they are installed, falling back
+    to the stock asyncio loop and h11 parser otherwise (uvloop is not declared
+    on Windows, where it doesn't build).
+
+    A single worker is kept on purpose: task managers hold their tasks in memory,
+    so extra worker processes would not see each other's tasks.
+    """
+    # find_spec only locates the packages; uvicorn imports whichever it is told to use
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info(f"Starting uvicorn with loop={loop}, http={http}")
+    return {"loop": loop, "http": http}
+
+
 # -----------------------------------------------------------------------------
 # 🚀 A2AServer Class: The Core Server Logic
 # -----------------------------------------------------------------------------
@@ -70,7 +98,7 @@ class A2AServer:
         self.task_manager = task_manager
 
         # 🌐 Starlette app initialization
-        self.app = Starlette()
+        self.app = Starlette(lifespan=self._lifespan)
 
         # 📥 Register a route to handle task requests (JSON-RPC POST)
         self.app.add_route("/", self._handle_request, methods=["POST"])
@@ -78,6 +106,33 @@ class A2AServer:
         # 🔎 Register a route for agent discovery (metadata as JSON)
         self.app.add_route("/.well-known/agent.json", self._get_agent_card, methods=["GET"])
 
+    # -----------------------------------------------------------------------------
+    # 🔥 _lifespan(): Warm the agent up in the background while serving
+    # -----------------------------------------------------------------------------
+    @asynccontextmanager
+    async def _lifespan(self, app):
+        """
+        If the task manager's agent exposes `mcp_tools` (the MCPTools it calls),
+        spawn their MCP servers in the background at startup so the first
+        request doesn't pay for it. The server accepts requests immediately.
+
+        On shutdown, close the agent's MCPConnector (if it has one) so its
+        stdio MCP server processes exit cleanly instead of being orphaned, and
+        call the agent's own aclose() (e.g. the orchestrator's HTTP pools).
+        """
+        agent = getattr(self.task_manager, "agent", None)
+        tools = getattr(agent, "mcp_tools", None)
+        task = asyncio.create_task(prewarm_tools(tools)) if tools else None
+        yield
+        if task and not task.done():
+            task.cancel()
+        connector = getattr(agent, "mcp", None)
+        if connector is not None:
+            await connector.aclose()
+        close = getattr(agent, "aclose", None)
+        if close is not None:
+            await close()
+
     # -----------------------------------------------------------------------------
     # ▶️ start(): Launch the web server using uvicorn
     # -----------------------------------------------------------------------------
@@ -91,7 +146,7 @@ class A2AServer:
 
         # Dynamically import uvicorn so it’s only loaded when needed
         import uvicorn
-        uvicorn.run(self.app, host=self.host, port=self.port)
+        uvicorn.run(self.app, host=self.host, port=self.port, **uvicorn_loop_options())
 
     # -----------------------------------------------------------------------------
     # 🔎 _get_agent_card(): Return the agent’s metadata (GET request)
@@ -120,7 +175,8 @@ class A2AServer:
         try:
             # Step 1: Parse incoming JSON body
             body = await request.json()
-            print("\n🔍 Incoming JSON:", json.dumps(body, indent=2))  # Log input for visibility
+            if DEBUG_PAYLOADS:
+                print("\n🔍 Incoming JSON:", json.dumps(body, indent=2))  # Log input for visibility
 
             # Step 2: Parse and validate request using discriminated union
             json_rpc = A2ARequest.validate_python(body)
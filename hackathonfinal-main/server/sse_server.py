@@ -12,15 +12,35 @@ import logging
 from datetime import datetime
 from typing import AsyncGenerator
 import uuid
+from contextlib import asynccontextmanager
 
 from models.agent import AgentCard
 from models.request import A2ARequest, SendTaskRequest
 from models.json_rpc import JSONRPCResponse, InternalError
 from server import task_manager
+from server.server import uvicorn_loop_options
 from fastapi.encoders import jsonable_encoder
 
 logger = logging.getLogger(__name__)
 
+# Seconds of silence before an SSE comment ping is sent, so proxies and
+# browsers don't drop the stream while a slow agent is still working
+SSE_KEEPALIVE_INTERVAL = 15
+
+# Fixed events every stream emits, framed and JSON-encoded once at import
+# rather than run through json.dumps again for each request
+THINKING_SSE = "data: " + json.dumps({
+    "type": "thinking",
+    "agent": "orchestrator",
+    "content": "Processing your request..."
+}) + "\n\n"
+ROUTING_SSE = "data: " + json.dumps({
+    "type": "status",
+    "agent": "orchestrator",
+    "content": "Routing to appropriate agent..."
+}) + "\n\n"
+DONE_SSE = "data: " + json.dumps({"type": "done"}) + "\n\n"
+
 def json_serializer(obj):
     if isinstance(obj, datetime):
         return obj.isoformat()
@@ -32,7 +52,7 @@ class SSEServer:
         self.port = port
         self.agent_card = agent_card
         self.task_manager = task_manager
-        self.app = Starlette()
+        self.app = Starlette(lifespan=self._lifespan)
         
         # Add CORS middleware for SSE
         self.app.add_middleware(
@@ -53,11 +73,19 @@ class SSEServer:
         # Store active streams
         self.active_streams = {}
 
+    @asynccontextmanager
+    async def _lifespan(self, app):
+        """On shutdown, let the agent release what it holds (e.g. the orchestrator's HTTP pools)."""
+        yield
+        close = getattr(getattr(self.task_manager, "agent", None), "aclose", None)
+        if close is not None:
+            await close()
+
     def start(self):
         if not self.agent_card or not self.task_manager:
             raise ValueError("Agent card and task manager are required")
         import uvicorn
-        uvicorn.run(self.app, host=self.host, port=self.port)
+        uvicorn.run(self.app, host=self.host, port=self.port, **uvicorn_loop_options())
 
     def _get_agent_card(self, request: Request) -> JSONResponse:
         response_data = jsonable_encoder(self.agent_card.model_dump())
@@ -105,11 +133,7 @@ class SSEServer:
             async def event_generator() -> AsyncGenerator[str, None]:
                 try:
                     # Send initial thinking message
-                    yield self._format_sse({
-                        "type": "thinking",
-                        "agent": "orchestrator",
-                        "content": "Processing your request..."
-                    })
+                    yield THINKING_SSE
                     
                     # Check if task_manager has streaming support
                     if hasattr(self.task_manager, 'handle_send_task_streaming'):
@@ -118,11 +142,7 @@ class SSEServer:
                             yield self._format_sse(event)
                     else:
                         # Fallback: simulate streaming with status updates
-                        yield self._format_sse({
-                            "type": "status",
-                            "agent": "orchestrator",
-                            "content": "Routing to appropriate agent..."
-                        })
+                        yield ROUTING_SSE
                         
                         # Get the actual response
                         response = await self.task_manager.handle_send_task(send_task_request)
@@ -136,7 +156,7 @@ class SSEServer:
                         })
                     
                     # Send done signal
-                    yield self._format_sse({"type": "done"})
+                    yield DONE_SSE
                     
                 except Exception as e:
                     logger.error(f"Streaming error: {e}")
@@ -146,7 +166,7 @@ class SSEServer:
                     })
             
             return StreamingResponse(
-                event_generator(),
+                self._with_keepalive(event_generator()),
                 media_type="text/event-stream",
                 headers={
                     "Cache-Control": "no-cache",
@@ -163,6 +183,40 @@ class SSEServer:
                 headers={"Access-Control-Allow-Origin": "*"}
             )
     
+    async def _with_keepalive(self, events: AsyncGenerator[str, None]) -> AsyncGenerator[str, None]:
+        """Relay SSE messages, sending a comment ping whenever the stream goes quiet"""
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        # Drive the generator from one task so its context stays in one place
+        async def pump():
+            try:
+                async for message in events:
+                    await queue.put(message)
+            finally:
+                queue.put_nowait(finished)
+
+        producer = asyncio.create_task(pump())
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is finished:
+                    break
+                yield message
+        finally:
+            # Client went away (or we're done): stop the upstream work too, and
+            # let it unwind before returning so nothing outlives the response
+            producer.cancel()
+            await asyncio.wait({producer})
+        # The stream ended because the upstream generator raised: surface that
+        # here instead of leaving it on an unobserved task
+        if not producer.cancelled() and producer.exception() is not None:
+            raise producer.exception()
+    
     def _format_sse(self, data: dict) -> str:
         """Format data as SSE message"""
         return f"data: {json.dumps(data)}\n\n"
\ No newline at end of file
@@ -12,14 +12,9 @@ PROJECT_DIR="$(cd "$(dirname "$0")" && pwd)"
 
 # Kill any existing processes on the target ports
 echo "🔪 Killing existing processes on ports 10000-10008..."
-lsof -ti:10000 | xargs kill -9 2>/dev/null || echo "No process on port 10000"
-lsof -ti:10003 | xargs kill -9 2>/dev/null || echo "No process on port 10003" 
-lsof -ti:10002 | xargs kill -9 2>/dev/null || echo "No process on port 10002"
-lsof -ti:10004 | xargs kill -9 2>/dev/null || echo "No process on port 10004"
-lsof -ti:10005 | xargs kill -9 2>/dev/null || echo "No process on port 10005"
-lsof -ti:10006 | xargs kill -9 2>/dev/null || echo "No process on port 10006"
-lsof -ti:10007 | xargs kill -9 2>/dev/null || echo "No process on port 10007"
-lsof -ti:10008 | xargs kill -9 2>/dev/null || echo "No process on port 10008"
+# One lsof call covers every agent port instead of forking it once per port
+AGENT_PORTS="10000,10002,10003,10004,10005,10006,10007,10008"
+lsof -ti:"$AGENT_PORTS" | xargs kill -9 2>/dev/null || echo "No processes on agent ports"
 
 # Wait a moment for processes to fully terminate
 sleep 2
@@ -31,7 +26,8 @@ if [ ! -f ".env" ]; then
     exit 1
 fi
 
-if ! grep -q "GOOGLE_API_KEY=" .env || grep -q "your_google_api_key_here" .env; then
+# One pass over .env: the key must be present and not still the placeholder
+if ! awk '/GOOGLE_API_KEY=/ { found = 1 } /your_google_api_key_here/ { placeholder = 1 } END { exit !(found && !placeholder) }' .env; then
     echo "❌ Error: Please set your GOOGLE_API_KEY in .env file"
     echo "Edit .env and replace 'your_google_api_key_here' with your actual API key"
     exit 1
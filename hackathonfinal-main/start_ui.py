@@ -7,9 +7,11 @@ This script starts all agents and then launches the web UI
 import subprocess
 import time
 import os
+import re
 import sys
 import signal
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Agent configurations - Orchestrator starts last
@@ -24,6 +26,13 @@ AGENTS = [
     {"name": "HostOrchestrator", "port": 10000, "module": "agents.host_agent.entry"}  # Start last
 ]
 
+# Host every agent binds to, and the dev server's default UI port
+AGENT_HOST = "localhost"
+UI_PORT = 5173
+
+# Matches the dev server's "Local: <url>" banner line in a single pass
+LOCAL_URL_PATTERN = re.compile(r"Local:\s*(\S+)")
+
 # Colors for terminal output
 BLUE = '\033[94m'
 GREEN = '\033[92m'
@@ -58,7 +67,7 @@ def check_port(port):
     """Check if a port is already in use."""
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
-        sock.bind(('localhost', port))
+        sock.bind((AGENT_HOST, port))
         sock.close()
         return False  # Port is available
     except OSError:
@@ -74,15 +83,14 @@ def kill_process_on_port(port):
             text=True
         )
         
-        if result.stdout.strip():
-            # Get the PID(s)
-            pids = result.stdout.strip().split('\n')
+        # Get the PID(s) - split() drops blank lines and trailing newlines in one pass
+        pids = result.stdout.split()
+        if pids:
+            # Kill them all with a single kill call
+            subprocess.run(["kill", "-9", *pids])
             for pid in pids:
-                if pid:
-                    # Kill the process
-                    subprocess.run(["kill", "-9", pid])
-                    print_status(f"Killed process {pid} on port {port}", "WARNING")
-                    time.sleep(0.5)  # Give it time to release the port
+                print_status(f"Killed process {pid} on port {port}", "WARNING")
+            time.sleep(0.5)  # Give it time to release the port
             return True
         return False
     except Exception as e:
@@ -101,7 +109,7 @@ def start_agent(agent):
     
     try:
         process = subprocess.Popen(
-            [sys.executable, "-m", agent["module"], "--host", "localhost", "--port", str(agent["port"])],
+            [sys.executable, "-m", agent["module"], "--host", AGENT_HOST, "--port", str(agent["port"])],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL
         )
@@ -145,8 +153,9 @@ def start_ui():
         
         # Wait for the UI to start and capture the URL
         for line in process.stdout:
-            if "Local:" in line:
-                url = line.strip().split("Local:")[1].strip()
+            match = LOCAL_URL_PATTERN.search(line)
+            if match:
+                url = match.group(1)
                 print_status(f"Web UI started at {url}", "SUCCESS")
                 print(f"\n{GREEN}{BOLD}✨ Open your browser at: {url}{RESET}")
                 break
@@ -185,15 +194,18 @@ def kill_all_agent_ports():
     """Kill all processes on agent ports before starting."""
     print_status("Cleaning up existing processes on agent ports...", "INFO")
     ports_to_kill = [agent["port"] for agent in AGENTS]
+    ports_to_kill.append(UI_PORT)  # Also kill common UI port
     
-    for port in ports_to_kill:
+    def clear_port(port):
         if check_port(port):
+            if port == UI_PORT:
+                print_status(f"Killing process on UI port {UI_PORT}...", "WARNING")
             kill_process_on_port(port)
     
-    # Also kill common UI port
-    if check_port(5173):
-        print_status("Killing process on UI port 5173...", "WARNING")
-        kill_process_on_port(5173)
+    # Each port's check is an lsof/kill round trip plus a settle delay, and the
+    # ports are independent, so check them all at once instead of one by one
+    with ThreadPoolExecutor(max_workers=len(ports_to_kill)) as pool:
+        list(pool.map(clear_port, ports_to_kill))
     
     print_status("Port cleanup complete", "SUCCESS")
     time.sleep(2)  # Give time for all ports to be fully released
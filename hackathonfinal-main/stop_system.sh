@@ -7,14 +7,15 @@ echo "🛑 Stopping Multi-Agent MCP System..."
 
 # Kill processes on target ports
 echo "🔪 Killing processes on ports 10000, 10003, 10002, 10004, 10005, 10006, 10007, 10008..."
-lsof -ti:10000 | xargs kill -9 2>/dev/null && echo "✅ Stopped process on port 10000" || echo "No process on port 10000"
-lsof -ti:10003 | xargs kill -9 2>/dev/null && echo "✅ Stopped process on port 10003" || echo "No process on port 10003"
-lsof -ti:10002 | xargs kill -9 2>/dev/null && echo "✅ Stopped process on port 10002" || echo "No process on port 10002"
-lsof -ti:10004 | xargs kill -9 2>/dev/null && echo "✅ Stopped process on port 10004" || echo "No process on port 10004"
-lsof -ti:10005 | xargs kill -9 2>/dev/null && echo "✅ Stopped process on port 10005" || echo "No process on port 10005"
-lsof -ti:10006 | xargs kill -9 2>/dev/null && echo "✅ Stopped process on port 10006" || echo "No process on port 10006"
-lsof -ti:10007 | xargs kill -9 2>/dev/null && echo "✅ Stopped process on port 10007" || echo "No process on port 10007"
-lsof -ti:10008 | xargs kill -9 2>/dev/null && echo "✅ Stopped process on port 10008" || echo "No process on port 10008"
+# One lsof call covers every agent port instead of forking it once per port
+AGENT_PORTS="10000,10003,10002,10004,10005,10006,10007,10008"
+pids=$(lsof -ti:"$AGENT_PORTS" 2>/dev/null)
+if [ -n "$pids" ]; then
+    echo "$pids" | xargs kill -9 2>/dev/null
+    echo "✅ Stopped $(echo "$pids" | wc -l | tr -d ' ') process(es) on agent ports"
+else
+    echo "No processes on agent ports"
+fi
 
 # Also kill any Python processes related to our agents
 echo "🔍 Cleaning up any remaining agent processes..."
@@ -74,10 +75,10 @@ echo "✅ System stopped successfully"
 
 # Final cleanup - wait a moment then check if any processes remain
 sleep 1
-remaining=$(lsof -ti:10000,10003,10002,10004,10005,10006,10007,10008 2>/dev/null | wc -l)
+remaining=$(lsof -ti:"$AGENT_PORTS" 2>/dev/null | wc -l)
 if [ "$remaining" -gt 0 ]; then
     echo "⚠️  Warning: $remaining processes still running on monitored ports"
-    echo "   Run 'lsof -i:10000,10003,10002,10004,10005,10006,10007,10008' to see details"
+    echo "   Run 'lsof -i:$AGENT_PORTS' to see details"
 else
     echo "✅ All processes cleaned up successfully"
 fi
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""Fixtures shared across the test suite."""
+
+import pytest
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when a test advances `now`."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    return FakeClock()
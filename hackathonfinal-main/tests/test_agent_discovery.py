@@ -0,0 +1,47 @@
+"""Tests for agent registry reloading in utilities.a2a.agent_discovery."""
+
+import json
+import os
+
+from utilities.a2a.agent_discovery import DiscoveryClient
+
+
+def write_registry(path, urls, mtime):
+    path.write_text(json.dumps(urls))
+    os.utime(path, (mtime, mtime))
+
+
+def test_registry_is_reloaded_only_after_it_changes(tmp_path, monkeypatch):
+    registry = tmp_path / "agent_registry.json"
+    write_registry(registry, ["http://localhost:10001"], mtime=1_000)
+    client = DiscoveryClient(registry_file=str(registry))
+    assert client.base_urls == ["http://localhost:10001"]
+
+    loads = 0
+    original_load = client._load_registry
+
+    def counting_load():
+        nonlocal loads
+        loads += 1
+        return original_load()
+
+    monkeypatch.setattr(client, "_load_registry", counting_load)
+
+    client._refresh_registry()
+    assert loads == 0  # Unchanged mtime: no re-read
+
+    write_registry(registry, ["http://localhost:10001", "http://localhost:10002"], mtime=2_000)
+    client._refresh_registry()
+    assert loads == 1
+    assert client.base_urls == ["http://localhost:10001", "http://localhost:10002"]
+
+
+def test_deleted_registry_empties_the_agent_list(tmp_path):
+    registry = tmp_path / "agent_registry.json"
+    write_registry(registry, ["http://localhost:10001"], mtime=1_000)
+    client = DiscoveryClient(registry_file=str(registry))
+
+    registry.unlink()
+    client._refresh_registry()
+
+    assert client.base_urls == []
@@ -0,0 +1,21 @@
+"""Tests for the Live Events servers' date normalization."""
+
+import pytest
+
+from event_dates import normalize_dttm
+
+
+@pytest.mark.parametrize(
+    ("value", "end_of_day", "expected"),
+    [
+        ("2025-2-8", False, "2025-02-08T00:00:00Z"),
+        ("2025-02-08", True, "2025-02-08T23:59:59Z"),
+        ("2025-02-08T10:00:00Z", False, "2025-02-08T10:00:00Z"),
+        ("2025-02-08T10:00:00", False, "2025-02-08T10:00:00Z"),
+        ("2025-02-08T10:00:00-05:00", False, "2025-02-08T15:00:00Z"),
+        ("2025-02-08T22:30:00-05:00", False, "2025-02-09T03:30:00Z"),
+        ("2025-02-08T01:00:00+09:00", False, "2025-02-07T16:00:00Z"),
+    ],
+)
+def test_normalize_dttm(value, end_of_day, expected):
+    assert normalize_dttm(value, end_of_day=end_of_day) == expected
@@ -0,0 +1,108 @@
+"""Tests for answer caching and in-flight question coalescing in the Flight SQL server."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from flight_sql_server_stdio import FlightSQLAnalyzer
+
+
+def make_analyzer(run) -> FlightSQLAnalyzer:
+    """Build an analyzer without a database or LLM, answering through `run`."""
+    analyzer = object.__new__(FlightSQLAnalyzer)
+    analyzer._answer_cache = {}
+    analyzer._inflight = {}
+    analyzer._run_sql_question = run
+    return analyzer
+
+
+async def test_concurrent_identical_questions_share_one_run():
+    calls = 0
+    release = asyncio.Event()
+
+    async def run(question, cache_key):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "answer"
+
+    analyzer = make_analyzer(run)
+    leader = asyncio.create_task(analyzer.analyze_sql_question("Cheapest route?"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(analyzer.analyze_sql_question("  cheapest ROUTE? "))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(leader, waiter) == ["answer", "answer"]
+    assert calls == 1
+    assert analyzer._inflight == {}
+
+
+async def test_cancelled_leader_gives_waiter_an_ordinary_error():
+    started = asyncio.Event()
+
+    async def run(question, cache_key):
+        started.set()
+        await asyncio.Event().wait()  # Never finishes on its own
+
+    analyzer = make_analyzer(run)
+    leader = asyncio.create_task(analyzer.analyze_sql_question("Cheapest route?"))
+    await started.wait()
+    waiter = asyncio.create_task(analyzer.analyze_sql_question("Cheapest route?"))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    with pytest.raises(RuntimeError, match="cancelled"):
+        await waiter
+    assert not waiter.cancelled()
+    assert analyzer._inflight == {}
+
+
+def tool_message(content, status="success"):
+    """The fields of a LangChain ToolMessage that the analyzer reads."""
+    return SimpleNamespace(content=content, status=status)
+
+
+class FakeGraph:
+    """Stands in for the compiled LangGraph workflow, ending on `final`."""
+
+    def __init__(self, final):
+        self.final = final
+        self.runs = 0
+
+    async def astream(self, inputs, stream_mode):
+        self.runs += 1
+        yield {"messages": [self.final]}
+
+
+def make_graph_analyzer(final) -> FlightSQLAnalyzer:
+    analyzer = object.__new__(FlightSQLAnalyzer)
+    analyzer._answer_cache = {}
+    analyzer._inflight = {}
+    analyzer.langgraph_agent = FakeGraph(final)
+    return analyzer
+
+
+@pytest.mark.parametrize(
+    "final",
+    [
+        tool_message("no such table: flights", status="error"),
+        tool_message("Error: (duckdb.BinderException) bad column"),
+    ],
+)
+async def test_failed_tool_result_is_not_cached(final):
+    analyzer = make_graph_analyzer(final)
+    await analyzer.analyze_sql_question("Cheapest route?")
+    await analyzer.analyze_sql_question("Cheapest route?")
+    assert analyzer._answer_cache == {}
+    assert analyzer.langgraph_agent.runs == 2
+
+
+async def test_successful_tool_result_is_cached():
+    analyzer = make_graph_analyzer(tool_message("[('ORD', 'LAX', 129.0)]"))
+    first = await analyzer.analyze_sql_question("Cheapest route?")
+    assert await analyzer.analyze_sql_question("Cheapest route?") == first
+    assert analyzer.langgraph_agent.runs == 1
@@ -0,0 +1,59 @@
+"""Tests for the per-event-loop HTTP pool and the connectors that use it."""
+
+import asyncio
+from types import SimpleNamespace
+
+from agents.host_agent.orchestrator import OrchestratorAgent
+from utilities.http_pool import LoopBoundClient
+
+
+async def test_same_loop_reuses_one_client():
+    pool = LoopBoundClient()
+    assert pool.get() is pool.get()
+    await pool.aclose()
+
+
+def test_new_loop_closes_the_previous_client():
+    pool = LoopBoundClient()
+
+    async def grab():
+        client = pool.get()
+        await asyncio.gather(*pool._closing)  # Let any stale-pool close finish
+        return client
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+
+    assert second is not first
+    assert first.is_closed
+    assert not second.is_closed
+    asyncio.run(pool.aclose())
+    assert second.is_closed
+
+
+async def test_aclose_from_another_thread_closes_on_the_owning_loop():
+    pool = LoopBoundClient()
+    client = pool.get()
+
+    await asyncio.to_thread(asyncio.run, pool.aclose())
+
+    assert client.is_closed
+
+
+async def test_rediscovery_returns_replaced_and_removed_connectors():
+    orchestrator = object.__new__(OrchestratorAgent)
+    orchestrator.connectors = {}
+    orchestrator.agent_urls = {}
+    orchestrator._update_connectors([
+        SimpleNamespace(name="flight", url="http://localhost:10001"),
+        SimpleNamespace(name="weather", url="http://localhost:10002"),
+    ])
+    flight, weather = orchestrator.connectors["flight"], orchestrator.connectors["weather"]
+
+    retired = orchestrator._update_connectors([
+        SimpleNamespace(name="flight", url="http://localhost:20001"),
+    ])
+
+    assert set(retired) == {flight, weather}
+    assert list(orchestrator.connectors) == ["flight"]
+    assert orchestrator.connectors["flight"] is not flight
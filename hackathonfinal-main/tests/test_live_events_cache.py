@@ -0,0 +1,69 @@
+"""Tests for the Live Events server's Ticketmaster response cache."""
+
+import pytest
+
+import live_events_server
+from live_events_server import EVENTS_CACHE_MAX_ENTRIES, EVENTS_CACHE_TTL, EventsApiClient
+from ttl_cache import TTLCache
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, payload: dict):
+        self.status_code = status_code
+        self.payload = payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self) -> dict:
+        return self.payload
+
+
+class FakeHttpClient:
+    """Answers with the queued responses and counts the requests made."""
+
+    def __init__(self, *responses: FakeResponse):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def get(self, url, params):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def make_client(monkeypatch, fake_clock):
+    """Build an EventsApiClient on a fake HTTP client, so no real httpx pool is ever opened."""
+
+    def build(*responses: FakeResponse) -> EventsApiClient:
+        fake = FakeHttpClient(*responses)
+        monkeypatch.setattr(live_events_server.httpx, "AsyncClient", lambda **kwargs: fake)
+        api = EventsApiClient(api_key="test-key")
+        api._cache = TTLCache(EVENTS_CACHE_TTL, EVENTS_CACHE_MAX_ENTRIES, clock=fake_clock)
+        return api
+
+    return build
+
+
+async def test_repeat_search_is_served_from_cache_until_ttl(make_client, fake_clock):
+    api = make_client(FakeResponse(200, {"page": 1}), FakeResponse(200, {"page": 2}))
+    window = ("2025-02-08T00:00:00Z", "2025-02-28T23:59:59Z")
+
+    assert await api.fetch_events("Chicago", *window) == {"page": 1}
+    fake_clock.now += EVENTS_CACHE_TTL - 1
+    assert await api.fetch_events("  chicago ", *window) == {"page": 1}  # City is normalized
+    assert api.client.calls == 1
+
+    fake_clock.now += 1
+    assert await api.fetch_events("Chicago", *window) == {"page": 2}
+    assert api.client.calls == 2
+
+
+async def test_failed_search_is_not_cached(make_client):
+    api = make_client(FakeResponse(503, {}), FakeResponse(200, {"page": 1}))
+    window = ("2025-02-08T00:00:00Z", "2025-02-28T23:59:59Z")
+
+    assert await api.fetch_events("Chicago", *window) is None
+    assert await api.fetch_events("Chicago", *window) == {"page": 1}
+    assert api.client.calls == 2
@@ -0,0 +1,34 @@
+"""Tests for the Live Events HTTP server's shutdown handling."""
+
+import pytest
+
+import live_events_server
+
+
+class ClosingClient:
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize("transport, runner", [
+    ("streamable-http", "run_streamable_http_async"),
+    ("sse", "run_sse_async"),
+])
+async def test_serve_closes_the_api_client_when_the_server_stops(monkeypatch, transport, runner):
+    client = ClosingClient()
+    ran = []
+
+    async def fake_run():
+        ran.append(runner)
+        raise KeyboardInterrupt  # However the server stops, the client is closed
+
+    monkeypatch.setattr(live_events_server, "api_client", client)
+    monkeypatch.setattr(live_events_server.app, runner, fake_run)
+
+    with pytest.raises(KeyboardInterrupt):
+        await live_events_server.serve(transport)
+
+    assert ran == [runner]
+    assert client.closed
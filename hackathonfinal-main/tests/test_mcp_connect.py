@@ -0,0 +1,71 @@
+"""Tests for the shared MCP server session in utilities.mcp.mcp_connect."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from mcp import StdioServerParameters
+
+from utilities.mcp import mcp_connect
+from utilities.mcp.mcp_connect import MCPServerSession
+
+
+def make_session() -> MCPServerSession:
+    return MCPServerSession(StdioServerParameters(command="unused", args=[]))
+
+
+async def install_connection(session: MCPServerSession, client) -> asyncio.Task:
+    """Point `session` at a fake live connection that hands out `client`."""
+    loop = asyncio.get_running_loop()
+    session._loop = loop
+    session._ready = loop.create_future()
+    session._ready.set_result(client)
+    session._closing = asyncio.Event()
+    session._task = loop.create_task(session._closing.wait())
+    return session._task
+
+
+async def test_reset_with_stale_session_keeps_current_connection():
+    """A late failure on a replaced session must not tear down its successor."""
+    session = make_session()
+    old_client, new_client = object(), object()
+    await install_connection(session, new_client)
+    closing = session._closing
+
+    session.reset(old_client)
+
+    assert not closing.is_set()
+    assert session._task is not None
+    session.reset()  # cleanup
+
+
+async def test_reset_with_current_session_drops_connection():
+    session = make_session()
+    client = object()
+    task = await install_connection(session, client)
+
+    session.reset(client)
+
+    assert session._task is None
+    await asyncio.wait_for(task, 1)  # The owning task was told to close
+
+
+async def test_cancel_before_handshake_fails_waiters_instead_of_hanging(monkeypatch):
+    """get() callers must get an error, not wait forever, if the server task dies early."""
+    started = asyncio.Event()
+
+    @asynccontextmanager
+    async def never_connects(params):
+        started.set()
+        await asyncio.Event().wait()
+        yield None, None  # pragma: no cover
+
+    monkeypatch.setattr(mcp_connect, "stdio_client", never_connects)
+    session = make_session()
+    waiter = asyncio.create_task(session.get())
+    await started.wait()
+
+    session._task.cancel()
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(waiter, 1)
@@ -0,0 +1,44 @@
+"""Tests for the orchestrator's session bookkeeping."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from agents.host_agent.orchestrator import OrchestratorAgent
+
+
+def make_orchestrator(existing_session=None) -> OrchestratorAgent:
+    """Build an orchestrator around a mocked session service, without ADK or agents."""
+    orchestrator = object.__new__(OrchestratorAgent)
+    orchestrator._agent = SimpleNamespace(name="orchestrator_agent")
+    orchestrator._user_id = "orchestrator_user"
+    orchestrator._known_sessions = set()
+    orchestrator._runner = SimpleNamespace(session_service=SimpleNamespace(
+        get_session=AsyncMock(return_value=existing_session),
+        create_session=AsyncMock(),
+    ))
+    return orchestrator
+
+
+async def test_new_session_is_created_once_then_remembered():
+    orchestrator = make_orchestrator()
+    service = orchestrator._runner.session_service
+
+    await orchestrator._ensure_session("s1")
+    await orchestrator._ensure_session("s1")
+
+    service.get_session.assert_awaited_once()
+    service.create_session.assert_awaited_once_with(
+        app_name="orchestrator_agent", user_id="orchestrator_user", session_id="s1", state={}
+    )
+
+
+async def test_existing_session_is_looked_up_once_and_not_recreated():
+    orchestrator = make_orchestrator(existing_session=object())
+    service = orchestrator._runner.session_service
+
+    await orchestrator._ensure_session("s1")
+    await orchestrator._ensure_session("s1")
+    await orchestrator._ensure_session("s2")
+
+    assert service.get_session.await_count == 2
+    service.create_session.assert_not_awaited()
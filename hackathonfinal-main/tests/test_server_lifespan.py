@@ -0,0 +1,49 @@
+"""Tests for the A2A server's startup prewarm and shutdown cleanup."""
+
+import asyncio
+from types import SimpleNamespace
+
+from server.server import A2AServer
+
+
+class FakeSession:
+    def __init__(self):
+        self.started = asyncio.Event()
+
+    async def get(self):
+        self.started.set()
+
+
+class FakeConnector:
+    closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+async def test_lifespan_prewarms_mcp_tools_and_closes_the_connector():
+    session = FakeSession()
+    agent = SimpleNamespace(
+        mcp_tools=[SimpleNamespace(_session=session), SimpleNamespace(_session=session)],
+        mcp=FakeConnector(),
+    )
+    server = A2AServer(task_manager=SimpleNamespace(agent=agent))
+
+    async with server._lifespan(server.app):
+        await asyncio.wait_for(session.started.wait(), 1)
+
+    assert agent.mcp.closed
+
+
+async def test_lifespan_tolerates_agents_without_mcp_tools():
+    closed = []
+
+    async def aclose():
+        closed.append(True)
+
+    server = A2AServer(task_manager=SimpleNamespace(agent=SimpleNamespace(aclose=aclose)))
+
+    async with server._lifespan(server.app):
+        pass
+
+    assert closed == [True]
@@ -0,0 +1,56 @@
+"""Tests for the SSE server's keep-alive relay."""
+
+import asyncio
+
+import pytest
+
+from server import sse_server
+from server.sse_server import SSEServer
+
+
+async def collect(stream) -> list[str]:
+    return [message async for message in stream]
+
+
+async def test_upstream_error_reaches_the_consumer():
+    async def events():
+        yield "data: 1\n\n"
+        raise ValueError("upstream broke")
+
+    stream = SSEServer()._with_keepalive(events())
+    assert await stream.__anext__() == "data: 1\n\n"
+    with pytest.raises(ValueError, match="upstream broke"):
+        await stream.__anext__()
+
+
+async def test_quiet_stream_gets_keepalive_pings(monkeypatch):
+    monkeypatch.setattr(sse_server, "SSE_KEEPALIVE_INTERVAL", 0.01)
+
+    async def events():
+        await asyncio.sleep(0.05)
+        yield "data: late\n\n"
+
+    messages = await collect(SSEServer()._with_keepalive(events()))
+
+    assert messages[-1] == "data: late\n\n"
+    assert ": keep-alive\n\n" in messages
+
+
+async def test_closing_the_stream_waits_for_upstream_to_unwind():
+    unwound = False
+
+    async def events():
+        nonlocal unwound
+        try:
+            yield "data: 1\n\n"
+            await asyncio.Event().wait()  # Would run forever
+            yield "data: never\n\n"  # pragma: no cover
+        finally:
+            await asyncio.sleep(0)  # Cleanup that itself awaits
+            unwound = True
+
+    stream = SSEServer()._with_keepalive(events())
+    assert await stream.__anext__() == "data: 1\n\n"
+    await stream.aclose()
+
+    assert unwound
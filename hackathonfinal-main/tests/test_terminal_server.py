@@ -0,0 +1,49 @@
+"""Tests for the terminal MCP server's in-process directory listing."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from terminal_server import format_entry, list_directory
+
+
+def test_lists_files_dirs_and_symlinks(tmp_path):
+    (tmp_path / "notes.txt").write_text("hello")
+    (tmp_path / "sub").mkdir()
+    os.symlink("notes.txt", tmp_path / "link")
+    os.symlink("missing.txt", tmp_path / "dangling")
+
+    lines = list_directory(str(tmp_path)).splitlines()
+
+    assert lines[0] == "4 entries"
+    assert [line.split()[-1] for line in lines[1:]] == ["missing.txt", "notes.txt", "notes.txt", "sub"]
+    link_line = lines[2]
+    assert link_line.startswith("l") and link_line.endswith("link -> notes.txt")
+    assert lines[1].endswith("dangling -> missing.txt")
+    assert lines[3].startswith("-") and " 5 " in lines[3]
+    assert lines[4].startswith("d")
+
+
+def test_file_path_lists_the_file_itself(tmp_path):
+    target = tmp_path / "notes.txt"
+    target.write_text("hello")
+
+    lines = list_directory(str(target)).splitlines()
+
+    assert lines[0] == "1 entry"
+    assert lines[1].endswith(str(target))
+
+
+def test_missing_path_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list_directory(str(tmp_path / "nope"))
+
+
+def test_unreadable_entry_becomes_an_error_line():
+    def denied(follow_symlinks=True):
+        raise PermissionError(13, "Permission denied")
+
+    entry = SimpleNamespace(name="secret", path="/x/secret", stat=denied)
+
+    assert format_entry(entry) == "?????????? secret (cannot access: Permission denied)"
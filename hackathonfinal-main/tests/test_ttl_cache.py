@@ -0,0 +1,45 @@
+"""Tests for the TTL response cache shipped with the API-backed MCP servers."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SERVERS = Path(__file__).resolve().parent.parent / "mcp_servers"
+
+
+def load_ttl_cache(server_dir: str) -> type:
+    """Import one server's ttl_cache.py by path; each server ships its own copy."""
+    spec = importlib.util.spec_from_file_location(f"{server_dir}_ttl_cache", SERVERS / server_dir / "ttl_cache.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.TTLCache
+
+
+@pytest.fixture(params=["live_events_server", "amadeus_flight_server"])
+def ttl_cache_cls(request):
+    return load_ttl_cache(request.param)
+
+
+def test_entry_expires_after_ttl(ttl_cache_cls, fake_clock):
+    cache = ttl_cache_cls(ttl=60, max_entries=4, clock=fake_clock)
+    cache.put("ORD", {"events": 3})
+
+    fake_clock.now += 59.9
+    assert cache.get("ORD") == {"events": 3}
+    fake_clock.now += 0.1
+    assert cache.get("ORD") is None
+    assert len(cache) == 0
+
+
+def test_oldest_entry_is_evicted_when_full(ttl_cache_cls, fake_clock):
+    cache = ttl_cache_cls(ttl=60, max_entries=2, clock=fake_clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 10)  # Re-storing moves "a" behind "b"
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 10
+    assert cache.get("c") == 3
+    assert len(cache) == 2
@@ -74,3 +74,11 @@ class AgentConnector:
         logger.info(f"AgentConnector: received response from {self.name} for task {task_id}")
         # Return the Task Pydantic model for further processing by the orchestrator
         return task_result
+
+    async def close(self):
+        """
+        Release the HTTP connections pooled for this agent.
+
+        Called when discovery replaces or drops the agent, and at shutdown.
+        """
+        await self.client.close()
@@ -9,6 +9,7 @@
 
 import os                            # os provides functions for interacting with the operating system, such as file paths
 import json                          # json allows encoding and decoding JSON data
+import asyncio                       # asyncio.TaskGroup runs the discovery requests concurrently
 import logging                       # logging is used to record warning/error/info messages
 from typing import List             # List is a type hint for functions that return lists
 
@@ -48,9 +49,33 @@ class DiscoveryClient:
                 "agent_registry.json"
             )
 
-        # Immediately load the registry file into memory
+        # Immediately load the registry file into memory, remembering the
+        # file's mtime so later discoveries only re-read it after an edit
+        self._registry_mtime = self._registry_stat()
         self.base_urls = self._load_registry()
 
+    def _registry_stat(self) -> float | None:
+        """
+        Return the registry file's modification time, or None if it is missing.
+        """
+        try:
+            return os.stat(self.registry_file).st_mtime
+        except OSError:
+            return None
+
+    def _refresh_registry(self) -> None:
+        """
+        Reload base_urls if the registry file changed since it was last read.
+
+        A single stat per discovery; the JSON is only re-parsed after an edit,
+        so long-running callers (periodic re-discovery) pick up new agents.
+        """
+        mtime = self._registry_stat()
+        if mtime != self._registry_mtime:
+            self._registry_mtime = mtime
+            self.base_urls = self._load_registry()
+            logger.info(f"Reloaded agent registry: {self.registry_file}")
+
     def _load_registry(self) -> List[str]:
         """
         Load and parse the registry JSON file into a list of URLs.
@@ -84,12 +109,13 @@ class DiscoveryClient:
         Returns:
             List[AgentCard]: Successfully retrieved agent cards.
         """
-        cards: List[AgentCard] = []  # Prepare an empty list to collect AgentCard instances
+        # Pick up registry edits made since the last discovery
+        self._refresh_registry()
 
         # Create a new AsyncClient and ensure it's closed when done
         async with httpx.AsyncClient() as client:
-            # Iterate through each base URL in the registry
-            for base in self.base_urls:
+
+            async def fetch_card(base: str) -> AgentCard | None:
                 # Normalize URL (remove trailing slash) and append the discovery path
                 url = base.rstrip("/") + "/.well-known/agent.json"
                 try:
@@ -98,11 +124,15 @@ class DiscoveryClient:
                     # Raise an exception if the response status is 4xx or 5xx
                     response.raise_for_status()
                     # Convert the JSON response into an AgentCard Pydantic model
-                    card = AgentCard.model_validate(response.json())
-                    # Add the valid AgentCard to our list
-                    cards.append(card)
+                    return AgentCard.model_validate(response.json())
                 except Exception as e:
-                    # If anything goes wrong, log which URL failed and why
+                    # Failures are handled per agent so one dead URL can't cancel the rest
                     logger.warning(f"Failed to discover agent at {url}: {e}")
-        # Return the list of successfully fetched AgentCards
-        return cards
+                    return None
+
+            # Query every registered agent concurrently instead of one after another
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(fetch_card(base)) for base in self.base_urls]
+
+        # Keep registry order and drop the agents that failed
+        return [card for task in tasks if (card := task.result()) is not None]
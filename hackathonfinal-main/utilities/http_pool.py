@@ -0,0 +1,78 @@
+# =============================================================================
+# utilities/http_pool.py
+# =============================================================================
+# 🎯 Purpose:
+# One pooled httpx.AsyncClient per event loop, shared by the A2A client and the
+# Duffel MCP server. httpx clients are bound to the loop they were first used
+# on, so the pool is rebuilt when the caller moves to another loop - and the
+# old pool is closed rather than left holding its sockets.
+# =============================================================================
+
+import asyncio                        # Tracks which loop owns the pool
+import logging                        # Reports pools that could not be closed cleanly
+
+import httpx                          # Async HTTP client being pooled
+
+logger = logging.getLogger(__name__)
+
+
+class LoopBoundClient:
+    """
+    🔁 Lazily creates an httpx.AsyncClient and reuses it on the same event loop.
+
+    Attributes:
+        client_kwargs (dict): Arguments passed to httpx.AsyncClient on each (re)build.
+    """
+
+    def __init__(self, **client_kwargs):
+        """
+        Args:
+            **client_kwargs: httpx.AsyncClient options (timeout, limits, ...).
+        """
+        self.client_kwargs = client_kwargs
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closing: set[asyncio.Task] = set()  # Keeps stale-pool close tasks alive until done
+
+    def get(self) -> httpx.AsyncClient:
+        """
+        Return the pool for the running loop, building it on first use.
+
+        Returns:
+            httpx.AsyncClient: Client owned by the current event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            stale, stale_loop = self._client, self._loop
+            self._client = httpx.AsyncClient(**self.client_kwargs)
+            self._loop = loop
+            if stale is not None and not stale.is_closed:
+                task = loop.create_task(_close_on_owner(stale, stale_loop))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+        return self._client
+
+    async def aclose(self):
+        """Close the pool (on the loop that owns it) and forget it."""
+        client, loop = self._client, self._loop
+        self._client = None
+        self._loop = None
+        if client is not None and not client.is_closed:
+            await _close_on_owner(client, loop)
+
+
+async def _close_on_owner(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None):
+    """
+    Close `client` on the loop its connections belong to.
+
+    If that loop is still running in another thread (e.g. the orchestrator's
+    discovery thread retiring a connector used by the server loop), hand the
+    close over to it; otherwise close here and tolerate a loop that is gone.
+    """
+    try:
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+        else:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Could not cleanly close a stale HTTP pool: {e!r}")
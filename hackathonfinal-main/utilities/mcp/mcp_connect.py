@@ -4,7 +4,8 @@
 # 🎯 Purpose:
 #   Connect to each MCP server defined in mcp_config.json,
 #   open ephemeral sessions to list available tools, and
-#   provide an easy interface to call those tools on demand.
+#   provide an easy interface to call those tools on demand
+#   over one long-lived session per server.
 # =============================================================================
 
 import os  # For accessing environment variables and file paths
@@ -27,6 +28,117 @@ logger = logging.getLogger(__name__)
 # Configure the logger to output INFO-level and above messages
 logging.basicConfig(level=logging.INFO)
 
+# Upper bound on MCP servers spawned in parallel during tool discovery
+MAX_CONCURRENT_DISCOVERY = 4
+
+
+class MCPServerSession:
+    """
+    ♻️ Keeps a single stdio session to one MCP server open and shares it
+    between every MCPTool that server exposes.
+
+    The server is spawned lazily on the first call. The stdio transport is
+    entered and exited inside one background task, as anyio requires, and
+    is rebuilt whenever the event loop changes or the connection fails.
+    """
+    def __init__(self, params: StdioServerParameters):
+        # Command/args/env used to spawn the MCP server
+        self._params = params
+        # Background task that owns the stdio connection
+        self._task: asyncio.Task | None = None
+        # Resolves to the initialized ClientSession once the handshake is done
+        self._ready: asyncio.Future | None = None
+        # Set to ask the background task to close the connection
+        self._closing: asyncio.Event | None = None
+        # Loop the current connection is bound to
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Tasks still shutting down after a reset (kept so they aren't GC'd)
+        self._retired: set[asyncio.Task] = set()
+
+    async def get(self) -> ClientSession:
+        """
+        Return the live ClientSession, spawning the server if needed.
+        """
+        loop = asyncio.get_running_loop()
+        # No awaits between the check and the assignment, so concurrent
+        # first callers all end up waiting on the same connection
+        if (
+            self._task is None
+            or self._task.done()
+            or self._closing.is_set()
+            or self._loop is not loop
+        ):
+            self._loop = loop
+            self._ready = loop.create_future()
+            self._closing = asyncio.Event()
+            self._task = loop.create_task(self._serve(self._ready, self._closing))
+        return await asyncio.shield(self._ready)
+
+    async def _serve(self, ready: asyncio.Future, closing: asyncio.Event):
+        """
+        Own the stdio connection for its whole lifetime.
+        """
+        try:
+            async with stdio_client(self._params) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as sess:
+                    await sess.initialize()
+                    ready.set_result(sess)
+                    # Hold the connection open until reset() or aclose()
+                    await closing.wait()
+        except BaseException as e:
+            if not ready.done():
+                # get() callers are parked on this future; never leave it pending.
+                # A cancellation is reported as an ordinary error, since the
+                # waiters themselves were not cancelled.
+                if isinstance(e, Exception):
+                    ready.set_exception(e)
+                else:
+                    ready.set_exception(ConnectionError(f"MCP session closed before handshake: {e!r}"))
+            elif isinstance(e, Exception):
+                logger.warning(f"[MCPServerSession] Session closed with error: {e}")
+            if not isinstance(e, Exception):
+                raise
+
+    def _is_current(self, sess: ClientSession) -> bool:
+        """True if `sess` is the session the current connection handed out."""
+        ready = self._ready
+        return (
+            ready is not None
+            and ready.done()
+            and not ready.cancelled()
+            and ready.exception() is None
+            and ready.result() is sess
+        )
+
+    def reset(self, sess: ClientSession | None = None):
+        """
+        Drop the current connection so the next call spawns a fresh one.
+
+        Args:
+            sess: The session a failed call ran on. If given, the connection is
+                  only dropped while it is still the current one, so a late
+                  failure on an already-replaced session can't kill its healthy
+                  successor.
+        """
+        if self._task is None:
+            return
+        if sess is not None and not self._is_current(sess):
+            return
+        self._closing.set()
+        if not self._task.done():
+            self._retired.add(self._task)
+            self._task.add_done_callback(self._retired.discard)
+        self._task = None
+
+    async def aclose(self):
+        """
+        Close the connection and wait for the server process to exit.
+        """
+        task = self._task
+        self.reset()
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            await asyncio.gather(task, return_exceptions=True)
+
 
 class MCPTool:
     """
@@ -36,7 +148,7 @@ class MCPTool:
         name (str): Identifier for the tool (e.g., "run_command").
         description (str): Human-readable description of the tool.
         input_schema (dict): JSON schema defining the tool's expected arguments.
-        _params (StdioServerParameters): Command/args to start the MCP server.
+        _session (MCPServerSession): Shared connection to the MCP server.
     """
     def __init__(
         self,
@@ -45,41 +157,64 @@ class MCPTool:
         input_schema: dict,
         server_cmd: str,
         server_args: list[str],
-        server_env: dict = None
+        server_env: dict = None,
+        session: MCPServerSession = None
     ):
         # Store the tool's name and description for later reference
         self.name = name
         self.description = description
         # Save the JSON schema to validate the `args` passed to run()
         self.input_schema = input_schema
-        # Prepare stdio connection params so we can spawn the server on each call
-        self._params = StdioServerParameters(
-            command=server_cmd,
-            args=server_args,
-            env=server_env
+        # Reuse the server's shared session, or open a private one
+        self._session = session or MCPServerSession(
+            StdioServerParameters(
+                command=server_cmd,
+                args=server_args,
+                env=server_env
+            )
         )
 
     async def run(self, args: dict) -> str:
         """
         Invoke the tool by:
-          1. Spawning the MCP server via stdio
-          2. Initializing an MCP ClientSession
-          3. Calling the named tool with provided arguments
-          4. Closing the session automatically on exit
+          1. Reusing (or lazily spawning) the server's MCP session
+          2. Calling the named tool with provided arguments
+          3. Resetting the session if the call fails, so the next call reconnects
 
         Returns:
             The `content` from the tool's response, or the raw response if no content.
         """
-        # Create a stdio connection to the MCP server (ephemeral session)
-        async with stdio_client(self._params) as (read_stream, write_stream):
-            # Wrap the stdio streams in an MCP ClientSession
-            async with ClientSession(read_stream, write_stream) as sess:
-                # Perform any handshake or setup required by MCP
-                await sess.initialize()
-                # Call the tool on the server with given arguments
-                resp = await sess.call_tool(self.name, args)
-                # Return the `content` attribute if present, else string-ify the response
-                return getattr(resp, "content", str(resp))
+        # Fetch the long-lived session (spawns the server on first use)
+        sess = await self._session.get()
+        try:
+            # Call the tool on the server with given arguments
+            resp = await sess.call_tool(self.name, args)
+        except Exception:
+            # The connection may be broken; start fresh on the next call
+            # (unless another caller already replaced it)
+            self._session.reset(sess)
+            raise
+        # Return the `content` attribute if present, else string-ify the response
+        return getattr(resp, "content", str(resp))
+
+
+async def prewarm_tools(tools: list[MCPTool]):
+    """
+    🔥 Spawn the MCP servers behind `tools` ahead of time, so the first real
+    tool call doesn't pay for process start-up and the MCP handshake.
+
+    Each server is started once even if it backs several tools; failures are
+    logged and left for the first real call to retry.
+    """
+    sessions = list({id(tool._session): tool._session for tool in tools}.values())
+    results = await asyncio.gather(
+        *(session.get() for session in sessions), return_exceptions=True
+    )
+    failed = sum(isinstance(result, BaseException) for result in results)
+    if failed:
+        logger.warning(f"[MCPConnector] {failed} of {len(sessions)} MCP servers failed to prewarm")
+    else:
+        logger.info(f"[MCPConnector] Prewarmed {len(sessions)} MCP server sessions")
 
 
 class MCPConnector:
@@ -92,13 +227,41 @@ class MCPConnector:
         tools = connector.get_tools()
         result = await tools[0].run({"arg1": "value"})
     """
+    # Process-wide cache: absolute config path → discovered MCPTool list.
+    # The tool manifests don't change while the servers run, so every
+    # connector built from the same config reuses the first discovery.
+    _tool_cache: dict[str, list[MCPTool]] = {}
+
     def __init__(self, config_file: str = None):
         # Initialize MCPDiscovery to load server definitions from JSON
         self.discovery = MCPDiscovery(config_file=config_file)
         # Prepare an empty list to hold MCPTool objects
         self.tools: list[MCPTool] = []
-        # Load tools from all configured MCP servers immediately
-        self._load_all_tools()
+        # Reuse a previous discovery for this config, or load from every server now
+        cache_key = os.path.abspath(self.discovery.config_file)
+        cached = MCPConnector._tool_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"[MCPConnector] Reusing {len(cached)} cached tools")
+            self.tools = cached.copy()
+        else:
+            self._load_all_tools()
+            # Don't cache an empty result, so a later connector can retry
+            if self.tools:
+                MCPConnector._tool_cache[cache_key] = self.tools.copy()
+
+    @classmethod
+    def invalidate_tools(cls, config_file: str = None):
+        """
+        Forget cached tool lists so the next connector rediscovers them.
+
+        Args:
+            config_file (str, optional): Only drop the cache for this config.
+                                         If None, the whole cache is cleared.
+        """
+        if config_file is None:
+            cls._tool_cache.clear()
+        else:
+            cls._tool_cache.pop(os.path.abspath(config_file), None)
 
     def _load_all_tools(self):
         """
@@ -109,55 +272,70 @@ class MCPConnector:
         async def _fetch():
             # Get the mapping: server name → its config dict
             servers = self.discovery.list_servers()
-            # Iterate through each server entry
-            for name, info in servers.items():
-                # Extract the command (e.g., "python script.py") and args
-                cmd = info.get("command")
-                args = info.get("args", [])
-                env = info.get("env", {})
-                
-                # Resolve environment variables in env dict
-                resolved_env = {}
-                for key, value in env.items():
-                    if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                        # Extract variable name and resolve from environment
-                        var_name = value[2:-1]
-                        resolved_env[key] = os.getenv(var_name, value)
-                    else:
-                        resolved_env[key] = value
-                
-                logger.info(f"[MCPConnector] Fetching tools from MCP server: {name}")
-                # Prepare parameters for stdio_client
-                params = StdioServerParameters(command=cmd, args=args, env=resolved_env)
-                try:
-                    # Open a stdio connection to the MCP server
-                    async with stdio_client(params) as (r, w):
-                        # Wrap in a client session to talk MCP
-                        async with ClientSession(r, w) as sess:
-                            # Initialize the session (handshake)
-                            await sess.initialize()
-                            # Ask the server for its list of tools
-                            tool_list = (await sess.list_tools()).tools
-                            # For each declared tool, wrap it in MCPTool
-                            for t in tool_list:
-                                self.tools.append(
-                                    MCPTool(
-                                        name=t.name,
-                                        description=t.description,
-                                        input_schema=t.inputSchema,
-                                        server_cmd=cmd,
-                                        server_args=args,
-                                        server_env=resolved_env
+            # Each discovery spawns a server process; cap how many start at once
+            limit = asyncio.Semaphore(MAX_CONCURRENT_DISCOVERY)
+
+            async def _fetch_server(name: str, info: dict) -> list[MCPTool]:
+                async with limit:
+                    # Extract the command (e.g., "python script.py") and args
+                    cmd = info.get("command")
+                    args = info.get("args", [])
+                    env = info.get("env", {})
+                    
+                    # Resolve environment variables in env dict
+                    resolved_env = {}
+                    for key, value in env.items():
+                        if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
+                            # Extract variable name and resolve from environment
+                            var_name = value[2:-1]
+                            resolved_env[key] = os.getenv(var_name, value)
+                        else:
+                            resolved_env[key] = value
+                    
+                    logger.info(f"[MCPConnector] Fetching tools from MCP server: {name}")
+                    # Prepare parameters for stdio_client
+                    params = StdioServerParameters(command=cmd, args=args, env=resolved_env)
+                    server_tools: list[MCPTool] = []
+                    try:
+                        # Open a stdio connection to the MCP server
+                        async with stdio_client(params) as (r, w):
+                            # Wrap in a client session to talk MCP
+                            async with ClientSession(r, w) as sess:
+                                # Initialize the session (handshake)
+                                await sess.initialize()
+                                # Ask the server for its list of tools
+                                tool_list = (await sess.list_tools()).tools
+                                # One persistent session shared by all of this server's tools
+                                shared = MCPServerSession(params)
+                                # For each declared tool, wrap it in MCPTool
+                                for t in tool_list:
+                                    server_tools.append(
+                                        MCPTool(
+                                            name=t.name,
+                                            description=t.description,
+                                            input_schema=t.inputSchema,
+                                            server_cmd=cmd,
+                                            server_args=args,
+                                            server_env=resolved_env,
+                                            session=shared
+                                        )
                                     )
+                                logger.info(
+                                    f"[MCPConnector] Loaded {len(tool_list)} tools from {name}"
                                 )
-                            logger.info(
-                                f"[MCPConnector] Loaded {len(tool_list)} tools from {name}"
-                            )
-                except Exception as e:
-                    # If any error occurs (e.g., server not available), log a warning
-                    logger.warning(
-                        f"[MCPConnector] Failed to list tools from {name}: {e}"
-                    )
+                    except Exception as e:
+                        # If any error occurs (e.g., server not available), log a warning
+                        logger.warning(
+                            f"[MCPConnector] Failed to list tools from {name}: {e}"
+                        )
+                return server_tools
+
+            # Query the servers concurrently, then keep tools in config order
+            results = await asyncio.gather(
+                *(_fetch_server(name, info) for name, info in servers.items())
+            )
+            for server_tools in results:
+                self.tools.extend(server_tools)
 
         # Run the async fetch coroutine, handling existing event loop
         try:
@@ -189,6 +367,14 @@ class MCPConnector:
             else:
                 raise
 
+    async def aclose(self):
+        """
+        Shut down every MCP server session opened by this connector's tools.
+        """
+        sessions = {id(tool._session): tool._session for tool in self.tools}
+        for session in sessions.values():
+            await session.aclose()
+
     def get_tools(self) -> list[MCPTool]:
         """
         Return a shallow copy of the list of MCPTool instances.